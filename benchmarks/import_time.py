@@ -0,0 +1,61 @@
+"""Import and instantiation time of ``SeleniumLibraryToBrowser``.
+
+Every measurement runs in a fresh interpreter, so nothing is cached between runs.
+The benchmark also fails if importing or instantiating the library loads SeleniumLibrary,
+which must only be imported when its keyword documentation is needed.
+
+Usage: ``python benchmarks/import_time.py [runs] [--max-ms MILLISECONDS]``
+"""
+
+# ruff: noqa: T201
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import SeleniumLibraryToBrowser
+imported = time.perf_counter()
+SeleniumLibraryToBrowser.SeleniumLibraryToBrowser()
+instantiated = time.perf_counter()
+print(imported - start, instantiated - imported, "SeleniumLibrary" in sys.modules)
+"""
+
+
+def probe():
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(src=str(SRC))],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]) * 1000, float(output[1]) * 1000, output[2] == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("runs", nargs="?", type=int, default=5)
+    parser.add_argument(
+        "--max-ms", type=float, help="fail if the median import + init time exceeds this"
+    )
+    args = parser.parse_args()
+    results = [probe() for _ in range(args.runs)]
+    import_ms = statistics.median(result[0] for result in results)
+    init_ms = statistics.median(result[1] for result in results)
+    print(f"import   {import_ms:8.1f} ms")
+    print(f"init     {init_ms:8.1f} ms")
+    print(f"total    {import_ms + init_ms:8.1f} ms (median of {args.runs} runs)")
+    if any(result[2] for result in results):
+        sys.exit("SeleniumLibrary was imported during import or instantiation.")
+    if args.max_ms is not None and import_ms + init_ms > args.max_ms:
+        sys.exit(f"Import + init took longer than {args.max_ms} ms.")
+
+
+if __name__ == "__main__":
+    main()
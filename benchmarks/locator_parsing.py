@@ -0,0 +1,83 @@
+"""Microbenchmark for the locator translation of ``WebElement``.
+
+Compares the per-locator parse cost of the former per-strategy ``re.match`` loop
+with the precompiled strategy alternation, with and without the locator cache.
+
+Usage: ``python benchmarks/locator_parsing.py [iterations]``
+"""
+
+# ruff: noqa: T201
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from SeleniumLibraryToBrowser import WebElement
+
+LOCATORS = [
+    "id:login_button",
+    "id=username",
+    "css:div.container > form input[type='text']",
+    "css=table#results tr:nth-child(2)",
+    "xpath://div[@id='div_id']/a",
+    "xpath=//table//tr[3]/td[2]",
+    "//div[@class='menu']//a[text()='Logout']",
+    "(//input[@type='checkbox'])[2]",
+    "login_form",
+    "submit",
+    "name:password",
+    "partial link:Sign",
+    "data:automation:my_automation_id",
+    "css:div#div_id >> xpath:a[6] >> id:image1_id",
+    "cSs=div#div_id >> XpaTh=a[6] >> iD=image1_id",
+]
+
+
+def legacy_single_locator(locator: str) -> str:
+    """The translation as it was implemented before the precompiled alternation."""
+    for illegal_loc in ["dom"]:
+        if re.match(f"{illegal_loc} ?[:=] ?", locator, flags=re.IGNORECASE):
+            raise ValueError(f"Invalid locator strategy '{illegal_loc}'.")
+    for strategy, selector in WebElement.LOCATORS.items():
+        match = re.match(f"{strategy} ?[:=] ?", locator, flags=re.IGNORECASE)
+        if match:
+            return selector(locator[match.end() :])
+    if re.match(r"\(*//", locator):
+        return f"xpath={locator}"
+    return f"[id='{locator}'], [name='{locator}']"
+
+
+def legacy_from_string(locator: str) -> str:
+    if " >> " in locator:
+        return " >> ".join(legacy_from_string(loc) for loc in locator.split(" >> "))
+    return legacy_single_locator(locator)
+
+
+def parse_all(parser):
+    for locator in LOCATORS:
+        parser(locator)
+
+
+def measure(name: str, parser, iterations: int):
+    seconds = min(timeit.repeat(lambda: parse_all(parser), number=iterations, repeat=5))
+    per_locator = seconds / (iterations * len(LOCATORS)) * 1e6
+    print(f"{name:<32} {per_locator:8.2f} µs/locator")
+    return per_locator
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for locator in LOCATORS:
+        assert legacy_from_string(locator) == WebElement.from_string(locator), locator
+    WebElement.cache.resize(0)
+    before = measure("before (re.match per strategy)", legacy_from_string, iterations)
+    after = measure("after (precompiled alternation)", WebElement.from_string, iterations)
+    WebElement.cache.resize(1024)
+    cached = measure("after + locator cache", WebElement.from_string, iterations)
+    print(f"speedup uncached: {before / after:.1f}x, cached: {before / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
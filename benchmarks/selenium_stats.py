@@ -0,0 +1,145 @@
+"""Benchmark for the keyword analysis of ``SeleniumStats`` on a synthetic output.xml.
+
+Compares the former analyzer, which hashed the parent of every SeleniumLibrary call
+and walked up to it recursively, with the memoized one and with the streaming mode.
+The memoized analyzer also skips messages, statistics and errors, which the former one visited.
+
+Usage: ``python benchmarks/selenium_stats.py [selenium_calls]``
+"""
+
+# ruff: noqa: T201, PLR2004
+import hashlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from robot.api import ExecutionResult, ResultVisitor
+from robot.model import TestCase, TestSuite
+from robot.result import Keyword
+
+from SeleniumStats.__main__ import (
+    RF_MAJOR_VERSION,
+    ResultAnalyzer,
+    StreamingResultAnalyzer,
+    add_keyword_call,
+)
+
+SELENIUM_KEYWORDS = ["Click Element", "Input Text", "Wait Until Element Is Visible", "Go To"]
+CALLS_PER_USER_KEYWORD = 4
+USER_KEYWORDS_PER_TEST = 5
+TESTS_PER_SUITE = 50
+
+if RF_MAJOR_VERSION >= 7:
+    STATUS = '<status status="PASS" start="2024-01-01T00:00:00.000000" elapsed="0.001"/>\n'
+    MESSAGE = '<msg time="2024-01-01T00:00:00.000000" level="INFO">Clicking element.</msg>\n'
+    LIBRARY_ATTRIBUTE = "owner"
+    SCHEMA_VERSION = 5
+else:
+    STATUS = (
+        '<status status="PASS" starttime="20240101 00:00:00.000"'
+        ' endtime="20240101 00:00:00.001"/>\n'
+    )
+    MESSAGE = '<msg timestamp="20240101 00:00:00.000" level="INFO">Clicking element.</msg>\n'
+    LIBRARY_ATTRIBUTE = "library"
+    SCHEMA_VERSION = 4
+
+
+class LegacyResultAnalyzer(ResultAnalyzer):
+    """The analysis as it was implemented before the parent hashes were memoized."""
+
+    visit_message = ResultVisitor.visit_message
+    visit_statistics = ResultVisitor.visit_statistics
+    visit_errors = ResultVisitor.visit_errors
+
+    def start_keyword(self, keyword):
+        if keyword.libname in ["SeleniumLibrary", "SeleniumLibraryToBrowser"]:
+            parent = self.get_keyword_or_test_parent(keyword)
+            if isinstance(parent, (TestCase, TestSuite)):
+                parent_hash = hashlib.sha3_512(parent.longname.encode("UTF-8")).hexdigest()[16:32]
+            else:
+                parent_hash = hashlib.sha3_512(
+                    f"{parent.libname}{parent.name}".encode()
+                ).hexdigest()[16:32]
+            if RF_MAJOR_VERSION >= 7:
+                kw_name = keyword.name
+            else:
+                kw_name = keyword.name[len(keyword.libname) + 1 :]
+            add_keyword_call(self.keyword_calls, kw_name, parent_hash)
+
+    def get_keyword_or_test_parent(self, keyword):
+        if not isinstance(keyword.parent, (Keyword, TestCase, TestSuite)):
+            return self.get_keyword_or_test_parent(keyword.parent)
+        return keyword.parent
+
+
+def selenium_keyword(index):
+    name = SELENIUM_KEYWORDS[index % len(SELENIUM_KEYWORDS)]
+    return f'<kw name="{name}" {LIBRARY_ATTRIBUTE}="SeleniumLibrary">\n{MESSAGE}{STATUS}</kw>\n'
+
+
+def write_output_xml(path, selenium_calls):
+    calls_per_test = CALLS_PER_USER_KEYWORD * USER_KEYWORDS_PER_TEST
+    tests = max(1, selenium_calls // calls_per_test)
+    with path.open("w", encoding="UTF-8") as output:
+        output.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        output.write(f'<robot generator="Robot" schemaversion="{SCHEMA_VERSION}">\n')
+        output.write('<suite id="s1" name="Root">\n')
+        for test in range(tests):
+            if test % TESTS_PER_SUITE == 0:
+                if test:
+                    output.write(f"{STATUS}</suite>\n")
+                output.write(f'<suite id="s1-s{test}" name="Suite {test}">\n')
+            output.write(f'<test id="s1-s{test}-t1" name="Test {test}">\n')
+            for user_keyword in range(USER_KEYWORDS_PER_TEST):
+                output.write(f'<kw name="User Keyword {user_keyword}">\n<for flavor="IN">\n')
+                for call in range(CALLS_PER_USER_KEYWORD):
+                    output.write(f"<iter>\n{selenium_keyword(call)}{STATUS}</iter>\n")
+                output.write(f"{STATUS}</for>\n{STATUS}</kw>\n")
+            output.write(f"{selenium_keyword(test)}{STATUS}</test>\n")
+        output.write(f"{STATUS}</suite>\n{STATUS}</suite>\n")
+        output.write("<statistics/>\n<errors/>\n</robot>\n")
+    return tests * (calls_per_test + 1)
+
+
+def to_dicts(keyword_calls):
+    return {name: (call.call_count, call.parents) for name, call in keyword_calls.items()}
+
+
+def measure(name, analyze):
+    keyword_calls = {}
+    start = time.perf_counter()
+    analyze(keyword_calls)
+    seconds = time.perf_counter() - start
+    print(f"{name:<36} {seconds:8.2f} s")
+    return seconds, to_dicts(keyword_calls)
+
+
+def main():
+    selenium_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as directory:
+        output_xml = Path(directory) / "output.xml"
+        calls = write_output_xml(output_xml, selenium_calls)
+        size = output_xml.stat().st_size / 1024 / 1024
+        print(f"{calls} SeleniumLibrary calls, {size:.1f} MB output.xml")
+        result = ExecutionResult(str(output_xml))
+        before, legacy_calls = measure(
+            "before (hash per call, recursive)",
+            lambda calls: result.visit(LegacyResultAnalyzer(calls)),
+        )
+        after, memoized_calls = measure(
+            "after (memoized hashes, iterative)",
+            lambda calls: result.visit(ResultAnalyzer(calls)),
+        )
+        _, streamed_calls = measure(
+            "streaming incl. parsing",
+            lambda calls: StreamingResultAnalyzer(calls).analyze(str(output_xml)),
+        )
+    assert legacy_calls == memoized_calls == streamed_calls
+    print(f"speedup of the model visit: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
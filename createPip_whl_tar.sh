@@ -1,4 +1,5 @@
 #!/bin/zsh
+python -m SeleniumLibraryToBrowser.manifest
 libdoc SeleniumLibraryToBrowser doc/index.html
 surge doc robotframework-browser-migration.surge.sh
 check-manifest --update
@@ -22,6 +22,7 @@ setup(
     url="https://github.com/Snooz82/robotframework-browser-migration",
     package_dir={"": "src"},
     packages=find_packages("src"),
+    package_data={"SeleniumLibraryToBrowser": ["keywords.json"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.6",
@@ -1,22 +1,36 @@
+import base64
+import json
 import re
 import time
 from collections import namedtuple
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta, timezone
 from enum import Enum, auto
+from functools import lru_cache
 from itertools import count
 from pathlib import Path
-from typing import Any, ClassVar, Dict, Generator, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 from robot.api import SkipExecution, logger
 from robot.api.deco import library
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
-from robot.libraries.DateTime import convert_date
 from robot.result.model import Message
 from robot.result.model import TestCase as ResultTestCase
 from robot.running import EXECUTION_CONTEXTS
 from robot.running.model import TestCase
-from robot.utils import DotDict, secs_to_timestr, timestr_to_secs
+from robot.utils import DotDict, get_link_path, secs_to_timestr, timestr_to_secs
 from robotlibcore import DynamicCore, keyword
 
 from Browser import Browser, SupportedBrowsers
@@ -33,11 +47,13 @@ from Browser.utils.data_types import (
     MouseButton,
     MouseButtonAction,
     Scope,
+    ScreenshotReturnType,
     SelectAttribute,
     SelectionType,
 )
 from SeleniumLibraryToBrowser.keys import Keys
 
+from .cache import LocatorCache
 from .errors import (
     CookieNotFound,
     ElementNotFound,
@@ -46,12 +62,11 @@ from .errors import (
     NoSuchFrameException,
     WindowNotFound,
 )
-
-try:
-    from SeleniumLibrary import SeleniumLibrary
-except ImportError:
-    SeleniumLibrary = None
-
+from .manifest import describe_keywords, fingerprint, load_manifest
+from .polling import PollingScheduler
+from .registry import PageRegistry
+from .screenshots import FailureScreenshots, ScreenshotWriter
+from .sources import PageSourceLog
 
 EQUALS = AO["=="]
 NOT_EQUALS = AO["!="]
@@ -66,6 +81,136 @@ GREATER_THAN = AO[">"]
 DEFAULT_FILENAME_PAGE = "selenium-screenshot-{index}.png"
 DEFAULT_FILENAME_ELEMENT = "selenium-element-screenshot-{index}.png"
 EMBED = "EMBED"
+IN_PAGE_POLLING = timedelta(milliseconds=50)
+FRAME_TEXT_SEARCH = """(needle) => {
+    const normalize = (text) => text.replace(/\\s+/g, ' ').trim().toLowerCase();
+    const skipped = ['HEAD', 'NOSCRIPT', 'SCRIPT', 'STYLE', 'TEMPLATE'];
+    const textOf = (node) => {
+        let text = '';
+        for (const child of node.childNodes) {
+            if (child.nodeType === 3) {
+                text += child.nodeValue;
+            } else if (child.nodeType === 1 && !skipped.includes(child.nodeName)) {
+                const isButton =
+                    child.nodeName === 'INPUT' && ['button', 'submit'].includes(child.type);
+                text += isButton ? child.value : textOf(child.shadowRoot || child);
+            }
+        }
+        return text;
+    };
+    const crossOrigin = [];
+    const search = (doc, path) => {
+        if (doc.documentElement && normalize(textOf(doc.documentElement)).includes(needle)) {
+            return path;
+        }
+        const frames = doc.querySelectorAll('iframe, frame');
+        for (let index = 0; index < frames.length; index++) {
+            let frameDocument = null;
+            try {
+                frameDocument = frames[index].contentDocument;
+            } catch (e) {}
+            if (!frameDocument) {
+                crossOrigin.push([...path, index]);
+                continue;
+            }
+            const found = search(frameDocument, [...path, index]);
+            if (found) {
+                return found;
+            }
+        }
+        return null;
+    };
+    needle = normalize(needle);
+    return { found: search(document, []), crossOrigin };
+}"""
+FAST_FILL = """(element, args) => {
+    const isInput = element.nodeName === 'INPUT';
+    if (isInput && element.type === 'file') {
+        return 'file';
+    }
+    const inputTypes = [
+        'text', 'password', 'email', 'number', 'search', 'tel', 'url',
+        'color', 'date', 'time', 'datetime-local', 'month', 'range', 'week',
+    ];
+    const fillable = isInput
+        ? inputTypes.includes(element.type)
+        : element.nodeName === 'TEXTAREA' || element.isContentEditable;
+    if (!fillable || element.disabled || element.readOnly) {
+        return 'not editable';
+    }
+    element.focus();
+    if (element.isContentEditable) {
+        element.textContent = args.clear ? args.text : element.textContent + args.text;
+    } else {
+        const value = args.clear ? args.text : element.value + args.text;
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+    }
+    element.dispatchEvent(new Event('input', { bubbles: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true }));
+    return 'filled';
+}"""
+ELEMENT_INSPECTION = """(element, facts) => {
+    const result = { nodeName: element.nodeName };
+    if (facts.bbox) {
+        const rect = element.getBoundingClientRect();
+        let x = rect.x;
+        let y = rect.y;
+        let view = element.ownerDocument.defaultView;
+        while (view && view.frameElement) {
+            const frame = view.frameElement.getBoundingClientRect();
+            x += frame.x + view.frameElement.clientLeft;
+            y += frame.y + view.frameElement.clientTop;
+            view = view.parent;
+        }
+        // The offset of a cross-origin parent frame is not accessible, the caller falls back.
+        result.bbox = view === view.top ? { x, y, width: rect.width, height: rect.height } : null;
+    }
+    if (facts.attribute !== null) {
+        const value = element[facts.attribute];
+        result.attribute = value !== undefined ? value : element.getAttribute(facts.attribute);
+    }
+    return result;
+}"""
+TEXTFIELD_TYPES = [
+    "date",
+    "datetime-local",
+    "email",
+    "month",
+    "number",
+    "password",
+    "search",
+    "tel",
+    "text",
+    "time",
+    "url",
+    "week",
+    "file",
+]
+SPEED_EXEMPT_KEYWORDS = {
+    "maximize_browser_window",
+    "open_browser",
+    "reload_page",
+    "select_frame",
+    "set_screenshot_directory",
+    "set_selenium_implicit_wait",
+    "set_selenium_page_load_timeout",
+    "set_selenium_speed",
+    "set_selenium_timeout",
+    "switch_browser",
+    "switch_window",
+}
+KeysRecord = namedtuple("KeysRecord", "converted, original special")
+
+
+class KeywordDispatch(NamedTuple):
+    method: Callable
+    implemented: bool
+    speed_exempt: bool
 
 
 __version__ = "1.0.0"
@@ -104,6 +249,20 @@ class CookieInformation:
         return string
 
 
+def _compile_strategy_pattern(strategies, illegal_strategies) -> Pattern:
+    """Compiles all strategy prefixes into one alternation, tried in insertion order."""
+    illegal = "|".join(re.escape(name) for name in illegal_strategies)
+    names = "|".join(re.escape(name) for name in strategies)
+    return re.compile(
+        f"(?:(?P<illegal>{illegal})|(?P<strategy>{names})) ?[:=] ?", flags=re.IGNORECASE
+    )
+
+
+XPATH_PREFIX = re.compile(r"\(*//")
+DEFAULT_LOCATOR = re.compile(r"\[id='(.*)'], \[name='(.*)']")
+PLAYWRIGHT_TIMEOUT = re.compile(r"TimeoutError|Timeout \d+(\.\d+)?ms exceeded")
+
+
 class WebElement(str):
     @staticmethod
     def _data_parser(loc):
@@ -133,7 +292,25 @@ class WebElement(str):
         "default": lambda loc: f"css=[id={loc}], [name={loc}]",
         "nth": lambda loc: f"nth={loc}",
     }
+    ILLEGAL_STRATEGIES: ClassVar[List[str]] = ["dom"]
+    STRATEGY_PATTERN: ClassVar[Pattern] = _compile_strategy_pattern(LOCATORS, ILLEGAL_STRATEGIES)
     original_locator: Union[str, tuple] = ""
+    cache: ClassVar[LocatorCache] = LocatorCache()
+
+    @classmethod
+    def add_strategy(cls, name: str, selector: Callable[[str], str]):
+        cls.LOCATORS[name.lower()] = selector
+        cls._strategies_changed()
+
+    @classmethod
+    def remove_strategy(cls, name: str):
+        cls.LOCATORS.pop(name.lower(), None)
+        cls._strategies_changed()
+
+    @classmethod
+    def _strategies_changed(cls):
+        cls.STRATEGY_PATTERN = _compile_strategy_pattern(cls.LOCATORS, cls.ILLEGAL_STRATEGIES)
+        cls.cache.clear()
 
     @classmethod
     def from_any(cls, locator: Union[list, tuple, str]) -> "WebElement":
@@ -143,41 +320,50 @@ class WebElement(str):
 
     @classmethod
     def from_string(cls, locator: str) -> "WebElement":
-        if " >> " in locator:
-            web_elem = cls(" >> ".join(cls.from_string(loc) for loc in locator.split(" >> ")))
-        else:
-            web_elem = cls.get_single_locator(locator)
+        web_elem = cls.cache.get(locator)
+        if web_elem is not None:
+            return web_elem
+        web_elem = cls(" >> ".join(map(cls._translate, locator.split(" >> "))))
         web_elem.original_locator = locator
+        cls.cache.put(locator, web_elem)
         return web_elem
 
     @classmethod
     def from_list(cls, locator: List[str]) -> "WebElement":
-        web_elem = cls(" >> ".join(cls.from_string(loc) for loc in locator))
+        key = tuple(locator)
+        web_elem = cls.cache.get(key)
+        if web_elem is not None:
+            return web_elem
+        web_elem = cls(
+            " >> ".join(cls._translate(part) for loc in locator for part in loc.split(" >> "))
+        )
         web_elem.original_locator = " >> ".join(locator)
+        cls.cache.put(key, web_elem)
         return web_elem
 
     @classmethod
     def get_single_locator(cls, locator: str) -> "WebElement":
-        for illegal_loc in ["dom"]:
-            match = re.match(f"{illegal_loc} ?[:=] ?", locator, flags=re.IGNORECASE)
-            if match:
+        return cls(cls._translate(locator))
+
+    @classmethod
+    def _translate(cls, locator: str) -> str:
+        match = cls.STRATEGY_PATTERN.match(locator)
+        if match:
+            if match.group("illegal"):
                 raise ValueError(
-                    f"Invalid locator strategy '{illegal_loc}'.\n"
+                    f"Invalid locator strategy '{match.group('illegal').lower()}'.\n"
                     f"Please use a supported locator strategy instead.\n"
                     f"{list(cls.LOCATORS.keys())}"
                 )
-        for strategy, selector in cls.LOCATORS.items():
-            match = re.match(f"{strategy} ?[:=] ?", locator, flags=re.IGNORECASE)
-            if match:
-                loc = locator[match.end() :]
-                return cls(selector(loc))
-        if re.match(r"\(*//", locator):
-            return cls(f"xpath={locator}")
-        return cls(f"[id='{locator}'], [name='{locator}']")
+            selector = cls.LOCATORS[match.group("strategy").lower()]
+            return selector(locator[match.end() :])
+        if XPATH_PREFIX.match(locator):
+            return f"xpath={locator}"
+        return f"[id='{locator}'], [name='{locator}']"
 
     @staticmethod
     def is_default(locator: str):
-        match = re.fullmatch(r"\[id='(.*)'], \[name='(.*)']", locator)
+        match = DEFAULT_LOCATOR.fullmatch(locator)
         if match and match.group(1) == match.group(2):
             return match.group(1)
         return None
@@ -221,11 +407,35 @@ class V3Listener:
             self.depr = True
 
 
+class TestArtifactListener:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, sl2b: "SLtoB"):
+        self.sl2b = sl2b
+
+    def start_test(self, _test: TestCase, _result: ResultTestCase):
+        self.sl2b.failure_screenshots.start_test()
+        self.sl2b.page_sources.start_test()
+
+    def end_test(self, _test: TestCase, _result: ResultTestCase):
+        if self.sl2b.screenshot_writer is not None:
+            self.sl2b.screenshot_writer.flush()
+
+    def close(self):
+        if self.sl2b.screenshot_writer is not None:
+            self.sl2b.screenshot_writer.close()
+
+
 class PriorityLibrary(Enum):
     SeleniumLibraryToBrowser = auto()
     Browser = auto()
 
 
+class InputStrategy(Enum):
+    type = auto()
+    fill = auto()
+
+
 @library(converters={WebElement: WebElement.from_any})
 class SeleniumLibraryToBrowser(DynamicCore):
     """_*SeleniumLibraryToBrowser*_ is a compatibility layer between [https://robotframework.org/SeleniumLibrary|SeleniumLibrary] keyword design
@@ -390,6 +600,16 @@ class SeleniumLibraryToBrowser(DynamicCore):
         page_load_timeout=timedelta(minutes=5),
         *,
         prioritize_library: Optional[PriorityLibrary] = None,
+        locator_cache_size: int = 1024,
+        polling_interval: timedelta = timedelta(milliseconds=50),
+        max_polling_interval: timedelta = timedelta(milliseconds=500),
+        input_strategy: InputStrategy = InputStrategy.type,
+        async_screenshots: bool = False,
+        failure_screenshot_limit: Optional[int] = None,
+        failure_screenshot_interval: timedelta = timedelta(seconds=0),
+        deduplicate_failure_screenshots: bool = False,
+        page_source_files: bool = False,
+        page_source_max_size: Optional[int] = None,
         **browser_args: Optional[Dict],
     ):
         """_*SeleniumLibraryToBrowser*_ uses Robot Framework [https://robotframework-browser.org|Browser] library internally.
@@ -420,9 +640,20 @@ class SeleniumLibraryToBrowser(DynamicCore):
         | ``event_firing_webdriver`` | *NOT IMPLEMENTED* Because _*SeleniumLibraryToBrowser*_ works internally totally different as SeleniumLibrary, it can not use any SeleniumLibrary event_firing_webdriver. |
         | ``page_load_timeout`` | This timeout is used by `Open Browser`, `Go To`, `Reload` keyword as timeout for the page loading. |
         | ``prioritize_library`` | This argument can be used to set which library should be prioritized. See `Keyword Conflicts` for more information. |
+        | ``locator_cache_size`` | Number of translated locators that are kept in memory, so that recurring locators are not parsed again. ``0`` disables the cache. See `Get Locator Cache Statistics`. |
+        | ``polling_interval`` | First interval between two checks of ``Wait Until ...`` keywords that are evaluated by the library, like `Wait Until Element Contains`, and of `Switch Window`. Every further interval is twice as long. See `Get Polling Statistics`. |
+        | ``max_polling_interval`` | Maximum interval between two checks of these keywords. |
+        | ``input_strategy`` | How `Input Text` and `Input Password` enter the text. ``type`` types it key by key, ``fill`` sets the value with one call and fires ``input`` and ``change`` events. Can be overridden per call. |
+        | ``async_screenshots`` | If ``True``, `Capture Page Screenshot` and `Capture Element Screenshot` capture into a local temporary directory and return the final path immediately, while a background thread moves the file to its final location. All pending screenshots are written at the end of each test and when the library is closed. Embedded screenshots are not affected. |
+        | ``failure_screenshot_limit`` | Maximum number of screenshots the run-on-failure `Capture Page Screenshot` takes per test. Further failures of the test are not captured. |
+        | ``failure_screenshot_interval`` | Minimum time between two run-on-failure screenshots, so that failures in retry loops like ``Wait Until Keyword Succeeds`` are not all captured. |
+        | ``deduplicate_failure_screenshots`` | If ``True``, a run-on-failure screenshot that is identical to the previous one of the same page is not stored or embedded again, the log links the previous one instead. |
+        | ``page_source_files`` | If ``True``, `Log Source` and the keywords that log the page source on failure, like `Page Should Contain` or `Table Should Contain`, write the source to a gzip compressed ``page-source-<index>.html.gz`` next to the log file and log only a link to it. A source identical to one already logged in the same test is not written again. |
+        | ``page_source_max_size`` | Maximum number of characters of a logged page source. Longer sources are truncated. Also applies if ``page_source_files`` is not set, identical sources are then logged only once per test as well. |
         | ``browser_args`` | All other named arguments will be used to hand over to [https://robotframework-browser.org|Browser] library if it has not been imported before. |
 
         """
+        WebElement.cache.resize(locator_cache_size)
         self.sl2b = SLtoB(
             timeout=timeout,
             implicit_wait=implicit_wait,
@@ -431,12 +662,55 @@ class SeleniumLibraryToBrowser(DynamicCore):
             library=self,
             page_load_timeout=page_load_timeout,
             prioritize_library=prioritize_library,
+            input_strategy=input_strategy,
+            async_screenshots=async_screenshots,
+        )
+        self.sl2b.failure_screenshots = FailureScreenshots(
+            failure_screenshot_limit,
+            failure_screenshot_interval.total_seconds(),
+            deduplicate_failure_screenshots,
+        )
+        self.sl2b.page_sources = PageSourceLog(page_source_files, page_source_max_size)
+        if (
+            async_screenshots
+            or self.sl2b.failure_screenshots.active
+            or self.sl2b.page_sources.active
+        ):
+            self.ROBOT_LIBRARY_LISTENER = TestArtifactListener(self.sl2b)
+        self.sl2b.polling.configure(
+            polling_interval.total_seconds(), max_polling_interval.total_seconds()
         )
         self.run_on_failure_keyword = self.sl2b.resolve_keyword(run_on_failure)
         components = [self.sl2b]
         super().__init__(components)
-        self.sl = SeleniumLibrary() if SeleniumLibrary else None
+        self._dispatch: Dict[str, KeywordDispatch] = {
+            name: KeywordDispatch(
+                method,
+                "IMPLEMENTED" in method.robot_tags,
+                self._is_speed_exempt(name),
+            )
+            for name, method in self.keywords.items()
+        }
+        self._sl = None
+        self._sl_loaded = False
         self._running_on_failure_keyword = False
+        self._manifest_keywords: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def sl(self):
+        """SeleniumLibrary instance, only used for its keyword documentation.
+
+        Importing and instantiating SeleniumLibrary is slow, so it happens on first use.
+        ``None`` if SeleniumLibrary is not installed.
+        """
+        if not self._sl_loaded:
+            self._sl_loaded = True
+            try:
+                from SeleniumLibrary import SeleniumLibrary  # noqa: PLC0415
+            except ImportError:
+                return None
+            self._sl = SeleniumLibrary()
+        return self._sl
 
     @property
     def dry_run(self):
@@ -444,14 +718,17 @@ class SeleniumLibraryToBrowser(DynamicCore):
         return ctx.dry_run if ctx else False
 
     def keyword_implemented(self, name):
-        return "IMPLEMENTED" in self.get_keyword_tags(name)
+        return self._dispatch[name].implemented
 
     def run_keyword(self, name, args, kwargs=None):
-        if not self.keyword_implemented(name):
+        dispatch = self._dispatch[name]
+        if not dispatch.implemented:
             raise SkipExecution(f"Keyword '{name.replace('_', ' ').title() }' is not implemented")
         try:
-            retun_value = super().run_keyword(name, args, kwargs)
-            self.sleep_selenium_speed(name)
+            retun_value = dispatch.method(*args, **(kwargs or {}))
+            speed = self.sl2b.selenium_speed
+            if speed and not dispatch.speed_exempt:
+                time.sleep(speed.total_seconds())
             return retun_value
         except Exception as e:
             self.failure_occurred()
@@ -469,7 +746,7 @@ class SeleniumLibraryToBrowser(DynamicCore):
         try:
             self._running_on_failure_keyword = True
             if self.run_on_failure_keyword.lower() == "capture page screenshot":
-                self.sl2b.capture_page_screenshot()
+                self.sl2b.capture_failure_screenshot()
             else:
                 BuiltIn().run_keyword(self.run_on_failure_keyword)
         except Exception as err:
@@ -480,31 +757,19 @@ class SeleniumLibraryToBrowser(DynamicCore):
             self._running_on_failure_keyword = False
 
     def sleep_selenium_speed(self, kw_name: str):
-        checks = [
-            lambda name: name.startswith("capture"),
-            lambda name: "should" in name,
-            lambda name: "close" in name,
-            lambda name: name.startswith("get"),
-            lambda name: name.startswith("log"),
-            lambda name: name
-            in [
-                "maximize_browser_window",
-                "open_browser",
-                "reload_page",
-                "select_frame",
-                "set_screenshot_directory",
-                "set_selenium_implicit_wait",
-                "set_selenium_page_load_timeout",
-                "set_selenium_speed",
-                "set_selenium_timeout",
-                "switch_browser",
-                "switch_window",
-            ],
-        ]
-        for check in checks:
-            if check(kw_name.lower()):
-                return
-        time.sleep(self.sl2b.selenium_speed.total_seconds())
+        speed = self.sl2b.selenium_speed
+        if speed and not self._is_speed_exempt(kw_name):
+            time.sleep(speed.total_seconds())
+
+    @staticmethod
+    def _is_speed_exempt(kw_name: str) -> bool:
+        name = kw_name.lower()
+        return (
+            name.startswith(("capture", "get", "log"))
+            or "should" in name
+            or "close" in name
+            or name in SPEED_EXEMPT_KEYWORDS
+        )
 
     def get_keyword_names(self):
         if self.dry_run:
@@ -520,6 +785,9 @@ class SeleniumLibraryToBrowser(DynamicCore):
             return "*DEPRECATED* keyword is not implemented yet."
         if not self.keyword_implemented(name):
             return "KEYWORD IS NOT YET IMPLEMENTED."
+        documentation = self._get_manifest_keywords().get(name, {}).get("selenium_documentation")
+        if documentation:
+            return documentation
         try:
             name = getattr(self.sl, name).robot_name or name
             return self.sl.get_keyword_documentation(name)
@@ -527,6 +795,14 @@ class SeleniumLibraryToBrowser(DynamicCore):
             pass
         return super().get_keyword_documentation(name)
 
+    def _get_manifest_keywords(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the keywords of the manifest, or none if they differ from this library."""
+        if self._manifest_keywords is None:
+            manifest = load_manifest()
+            current = manifest.get("fingerprint") == fingerprint(describe_keywords(self))
+            self._manifest_keywords = manifest["keywords"] if current else {}
+        return self._manifest_keywords
+
 
 class SLtoB:
     def __init__(
@@ -538,9 +814,16 @@ class SLtoB:
         library: SeleniumLibraryToBrowser = None,
         page_load_timeout=timedelta(minutes=5),
         prioritize_library: Optional[PriorityLibrary] = None,
+        *,
+        input_strategy: InputStrategy = InputStrategy.type,
+        async_screenshots: bool = False,
     ):
         self.timeout = timeout
+        self.input_strategy = input_strategy
         self.screenshot_root_directory = screenshot_root_directory
+        self.screenshot_writer = ScreenshotWriter() if async_screenshots else None
+        self.failure_screenshots = FailureScreenshots()
+        self.page_sources = PageSourceLog()
         self.library = library
         self.page_load_timeout = page_load_timeout
         self._browser: Optional[Browser] = None
@@ -548,9 +831,12 @@ class SLtoB:
         self._context_indexes = {}
         self._context_aliases = {}
         self._browser_index = count(1)
-        self._context_page_catalog = {}
+        self._context_page_catalog = PageRegistry()
+        self._frame_stack: List[str] = []
+        self._get_key_plan = lru_cache(maxsize=256)(self._build_key_plan)
         self._selenium_speed = timedelta(seconds=0.0)
         self._implicit_wait = implicit_wait
+        self.polling = PollingScheduler()
         self.prioritize_library = prioritize_library
         if prioritize_library and BuiltIn().robot_running:
             _b = self.b
@@ -696,16 +982,118 @@ class SLtoB:
             locator.original_locator = original_locator
         return locator
 
-    def page_contains(self, locator):
-        self.b.set_selector_prefix(None, scope=Scope.Global)
-        if self.b.get_element_count(locator):
+    def page_contains(self, text: str) -> bool:
+        """Searches the text in the page and in all its frames and logs which frame contained it.
+
+        Same-origin frames are searched recursively within one evaluation in the page.
+        Only cross-origin frames, whose documents are not accessible from the page,
+        and quoted or regular expression texts are searched frame by frame with Playwright.
+        Like in SeleniumLibrary, the search returns to the top document.
+        """
+        self.unselect_frame()
+        if text[:1] in ("'", '"', "/"):
+            if self.b.get_element_count(f"text={text}"):
+                logger.info(f"Text {text} found in {self._describe_frame([])}.")
+                return True
+            frames = self.b.get_element_count("iframe, frame")
+            return self._frames_contain(text, [[index] for index in range(frames)])
+        result = self.b.evaluate_javascript(None, FRAME_TEXT_SEARCH, arg=text)
+        if result["found"] is not None:
+            logger.info(f"Text '{text}' found in {self._describe_frame(result['found'])}.")
             return True
-        cnt = self.b.get_element_count("iframe, frame")
-        for index in range(cnt):
-            if self.b.get_element_count(f"iframe, frame >> nth={index} >>> {locator}"):
+        return self._frames_contain(text, result["crossOrigin"])
+
+    def _frames_contain(self, text: str, frame_paths: List[List[int]]) -> bool:
+        for path in frame_paths:
+            if self.b.get_element_count(f"{self._frame_selector(path)} >>> text={text}"):
+                logger.info(f"Text '{text}' found in {self._describe_frame(path)}.")
                 return True
         return False
 
+    @staticmethod
+    def _frame_selector(path: List[int]) -> str:
+        return " >>> ".join(f"iframe, frame >> nth={index}" for index in path)
+
+    def _describe_frame(self, path: List[int]) -> str:
+        return f"frame '{self._frame_selector(path)}'" if path else "main document"
+
+    def _get_element_types(self, locator: WebElement) -> List[Tuple[str, str]]:
+        return [
+            tuple(info)
+            for info in self.b.evaluate_javascript(
+                locator,
+                "elements => elements.map(",
+                "    e => [e.nodeName, typeof e.type === 'string' ? e.type : '']",
+                ")",
+                all_elements=True,
+            )
+        ]
+
+    def _inspect_element(
+        self, locator: WebElement, bbox: bool = False, attribute: Optional[str] = None
+    ) -> DotDict:
+        """Returns the node name and the requested facts of the element in one evaluation.
+
+        ``bbox`` adds the bounding box relative to the main frame, or ``None`` if a parent
+        frame is cross-origin. ``attribute`` adds the value of the property with that name or,
+        if there is none, of the attribute.
+        """
+        return DotDict(
+            self._evaluate_on_element(
+                locator, ELEMENT_INSPECTION, {"bbox": bbox, "attribute": attribute}
+            )
+        )
+
+    def _get_element_bbox(self, locator: WebElement) -> Dict[str, float]:
+        bbox = self._inspect_element(locator, bbox=True).bbox
+        if bbox is None:
+            bbox = self.b.get_boundingbox(locator, BoundingBoxFields.ALL)
+        return bbox
+
+    def _evaluate_on_element(
+        self, locator: WebElement, function: str, arg: Any = None, error: Optional[str] = None
+    ) -> Any:
+        """Evaluates ``function`` with the first element of ``locator`` and ``arg``.
+
+        Unlike evaluating on the locator, this does not wait for the element, so an existing
+        element needs one call and a missing one fails after Browser's assertion retry time.
+        """
+        script = f"(elements, arg) => elements.length ? [({function})(elements[0], arg)] : []"
+        result = self.b.evaluate_javascript(locator, script, arg=arg, all_elements=True)
+        if not result:
+            self._wait_until_attached(locator, error)
+            result = self.b.evaluate_javascript(locator, script, arg=arg, all_elements=True)
+            if not result:
+                raise ElementNotFound(
+                    error or f"Element with locator '{locator.original_locator}' not found."
+                )
+        return result[0]
+
+    @contextmanager
+    def _element_must_exist(self, locator: WebElement, error: Optional[str] = None):
+        """Raises ``ElementNotFound`` if the wrapped calls fail because the element does not exist.
+
+        The element is only counted after a failure, so the success path has no extra call.
+        Like the element lookup of SeleniumLibrary, a missing element fails after the implicit
+        wait, which is the Browser timeout of this library.
+        """
+        try:
+            yield
+        except Exception as e:
+            if self.b.get_element_count(locator):
+                raise
+            raise ElementNotFound(
+                error or f"Element with locator '{locator.original_locator}' not found."
+            ) from e
+
+    def _wait_until_attached(self, locator: WebElement, error: Optional[str] = None):
+        try:
+            self.b.get_element_states(locator, CONTAINS, "attached")
+        except AssertionError as e:
+            raise ElementNotFound(
+                error or f"Element with locator '{locator.original_locator}' not found."
+            ) from e
+
     def type_converter(self, argument: Any) -> str:
         return type(argument).__name__.lower()
 
@@ -729,6 +1117,8 @@ class SLtoB:
         try:
             return int(expiry)
         except (ValueError, TypeError):
+            from robot.libraries.DateTime import convert_date  # noqa: PLC0415
+
             return int(convert_date(expiry, result_format="epoch"))
 
     @keyword
@@ -765,32 +1155,29 @@ class SLtoB:
         if not self.b.get_page_ids():
             logger.info("Cannot capture screenshot from element because no browser is open.")
             return None
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        embedding = self._decide_embedded(filename)
-        screenshot_file = (
-            EMBED
-            if embedding
-            else re.sub(".png$", "", self._get_screenshot_path(filename, embedding))
-        )
-        screenshot_path = self.b.take_screenshot(filename=screenshot_file, selector=locator)
-        return EMBED if embedding else screenshot_path
+        with self._element_must_exist(locator):
+            return self._take_screenshot(filename, locator)
 
     @keyword(tags=("IMPLEMENTED",))
     def capture_page_screenshot(self, filename: str = DEFAULT_FILENAME_PAGE) -> str:
         if not self.b.get_page_ids():
             logger.info("Cannot capture screenshot from element because no browser is open.")
             return None
-        embedding = self._decide_embedded(filename)
-        screenshot_file = (
-            EMBED
-            if embedding
-            else re.sub(".png$", "", self._get_screenshot_path(filename, embedding))
+        return self._take_screenshot(filename)
+
+    def capture_failure_screenshot(self) -> Optional[str]:
+        """Captures the page for the run-on-failure keyword within the configured limits."""
+        if not self.b.get_page_ids():
+            logger.info("Cannot capture screenshot from element because no browser is open.")
+            return None
+        reason = self.failure_screenshots.skip_reason()
+        if reason:
+            logger.info(f"Screenshot on failure is skipped, because {reason}.")
+            return None
+        self.failure_screenshots.record()
+        return self._take_screenshot(
+            DEFAULT_FILENAME_PAGE, deduplicate=self.failure_screenshots.deduplicate
         )
-        screenshot_path = self.b.take_screenshot(filename=screenshot_file)
-        return EMBED if embedding else screenshot_path
 
     @keyword(tags=("IMPLEMENTED",))
     def checkbox_should_be_selected(self, locator: WebElement):
@@ -925,7 +1312,7 @@ class SLtoB:
     @keyword(tags=("IMPLEMENTED",))
     def close_all_browsers(self):
         self.b.close_browser(SelectionType.ALL)
-        self._context_page_catalog = {}
+        self._context_page_catalog.clear()
         self._context_aliases = {}
         self._context_indexes = {}
         self._browser_index = count(1)
@@ -938,7 +1325,7 @@ class SLtoB:
         current_id = context_ids[0]
         for index, ctx_id in self._context_indexes.items():
             if ctx_id == current_id:
-                self._context_page_catalog.pop(ctx_id)
+                self._context_page_catalog.remove_context(ctx_id)
                 self._context_indexes.pop(index)
                 for alias, idx in self._context_aliases.items():
                     if idx == index:
@@ -1273,17 +1660,7 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def get_element_attribute(self, locator: WebElement, attribute: str):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        try:
-            return self.b.get_property(locator, attribute)
-        except AttributeError:
-            try:
-                return self.b.get_attribute(locator, attribute)
-            except AttributeError:
-                return None
+        return self._inspect_element(locator, attribute=attribute).attribute
 
     @keyword(tags=("IMPLEMENTED",))
     def get_element_count(self, locator: WebElement):
@@ -1291,20 +1668,12 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def get_element_size(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        value = self.b.get_boundingbox(locator, BoundingBoxFields.ALL)
-        return value["width"], value["height"]
+        bbox = self._get_element_bbox(locator)
+        return bbox["width"], bbox["height"]
 
     @keyword(tags=("IMPLEMENTED",))
     def get_horizontal_position(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        return self.b.get_boundingbox(locator, BoundingBoxFields.x)
+        return self._get_element_bbox(locator)["x"]
 
     @keyword(tags=("IMPLEMENTED",))
     def get_list_items(self, locator: WebElement, values: bool = False):
@@ -1319,58 +1688,67 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def get_locations(self, browser: str = "CURRENT"):
-        current_page = self._get_current_page_id()
-        try:
-            return list(self._generate_locations(browser))
-        finally:
-            self.b.switch_page(current_page, context=SelectionType.ALL, browser=SelectionType.ALL)
+        return [page["url"] for page in self._get_pages(browser)]
+
+    def _get_page_ids(self, context: str) -> List[str]:
+        return [page["id"] for page in self._get_pages(context)]
 
-    def _generate_locations(self, browser: str):
-        for page_id in self._get_page_ids(browser):
-            self.b.switch_page(page_id, context=SelectionType.ALL, browser=SelectionType.ALL)
-            yield self.b.get_url()
+    def _get_pages(self, context: str) -> List[Dict[str, Any]]:
+        """Returns the catalog entries of all pages of ``context`` in the order they were opened.
 
-    def _get_page_ids(self, context: str):
-        if context.upper() == "CURRENT":
-            return self._get_current_page_ids()
+        Served from one browser catalog call, without switching to any page.
+        """
+        catalog = self.b.get_browser_catalog()
         if context.upper() == "ALL":
-            return list(self._get_all_page_ids())
+            context_ids = None
+        elif context.upper() == "CURRENT":
+            context_ids = [
+                browser["activeContext"] for browser in catalog if browser["activeBrowser"]
+            ]
+        else:
+            context_ids = [self._get_pw_context_id(context)]
+        pages = {}
+        for browser in catalog:
+            for ctx in browser["contexts"]:
+                if context_ids is not None and ctx["id"] not in context_ids:
+                    continue
+                pages.update((page["id"], page) for page in ctx["pages"])
+                self._context_page_catalog.reconcile(
+                    ctx["id"], (page["id"] for page in ctx["pages"])
+                )
+        return [
+            pages[page_id]
+            for page_id in self._context_page_catalog.page_ids(context_ids)
+            if page_id in pages
+        ]
+
+    def _evaluate_in_pages(
+        self, pages: List[Dict[str, Any]], function: str, active_page: str
+    ) -> Generator[Tuple[str, Any], None, None]:
+        """Yields the page id and the result of ``function`` evaluated in each page.
+
+        JavaScript can only be evaluated in the active page, so all other pages are switched to.
+        Switching back to the original page is up to the caller.
+        """
+        for page in pages:
+            if page["id"] != active_page:
+                self.b.switch_page(page["id"], context=SelectionType.ALL, browser=SelectionType.ALL)
+                active_page = page["id"]
+            yield page["id"], self.b.evaluate_javascript(None, function)
 
-        ctx_id = self._get_pw_context_id(context)
-        org_context = self.b.switch_context(ctx_id, browser=SelectionType.ALL)
+    def _get_window_properties(self, browser: str, function: str) -> List[str]:
+        current_page = self._get_current_page_id()
+        pages = self._get_pages(browser)
+        # The active page goes first, it needs no switching.
+        ordered = sorted(pages, key=lambda page: page["id"] != current_page)
         try:
-            return self._get_current_page_ids()
+            values = dict(self._evaluate_in_pages(ordered, function, current_page))
+            return [values[page["id"]] or "undefined" for page in pages]
         finally:
-            self.b.switch_context(org_context, browser=SelectionType.ALL)
-
-    def _get_current_page_ids(self) -> List[str]:
-        pw_page_ids = self.b.get_page_ids(
-            browser=SelectionType.CURRENT, context=SelectionType.CURRENT
-        )
-        current_context_id = self._get_current_context_id()
-        for pw_page_id in pw_page_ids:
-            if pw_page_id not in self._context_page_catalog[current_context_id]:
-                self._context_page_catalog[current_context_id].append(pw_page_id)
-        for page_id in self._context_page_catalog[current_context_id]:
-            if page_id not in pw_page_ids:
-                self._context_page_catalog[current_context_id].remove(page_id)
-        return self._context_page_catalog[current_context_id]
-
-    def _get_all_page_ids(self) -> Generator[str, None, None]:
-        catalog = self.b.get_browser_catalog()
-        page_ids = []
-        for browser in catalog:
-            for context in browser["contexts"]:
-                for page in context["pages"]:
-                    page_ids.append(page["id"])
-                    if page["id"] not in self._context_page_catalog[context["id"]]:
-                        self._context_page_catalog[context["id"]].append(page["id"])
-                for page_id in self._context_page_catalog[context["id"]]:
-                    if page_id not in page_ids:
-                        self._context_page_catalog[context["id"]].remove(page_id)
-        for context in self._context_page_catalog:
-            for page in self._context_page_catalog[context]:
-                yield page
+            if any(page["id"] != current_page for page in pages):
+                self.b.switch_page(
+                    current_page, context=SelectionType.ALL, browser=SelectionType.ALL
+                )
 
     def _get_pw_context_id(self, context):
         if isinstance(context, str) and context.upper() == "CURRENT":
@@ -1386,6 +1764,33 @@ class SLtoB:
             raise WindowNotFound(f"Non-existing index or alias '{context}'.")
         return ctx_id
 
+    @keyword(tags=("IMPLEMENTED",))
+    def get_locator_cache_statistics(self) -> DotDict:
+        """Returns and logs the hit and miss counters of the locator translation cache.
+
+        The size of the cache can be set with the ``locator_cache_size`` argument in `Importing`.
+        """
+        stats = WebElement.cache.statistics()
+        logger.info(f"Locator cache: {WebElement.cache}")
+        return DotDict(stats)
+
+    @keyword(tags=("IMPLEMENTED",))
+    def get_polling_statistics(self) -> DotDict:
+        """Returns and logs how often the polling keywords checked their condition.
+
+        The statistics contain one entry per keyword, like `Wait Until Element Contains`
+        or `Switch Window`, with the number of calls and polls and the mean and maximum
+        time in seconds until the condition was met.
+        The intervals can be set with the ``polling_interval`` and ``max_polling_interval``
+        arguments in `Importing`.
+        """
+        stats = DotDict(
+            (name, DotDict(stat.as_dict())) for name, stat in self.polling.statistics.items()
+        )
+        for name, stat in stats.items():
+            logger.info(f"{name}: {', '.join(f'{k}={v}' for k, v in stat.items())}")
+        return stats
+
     @keyword(tags=("IMPLEMENTED",))
     def get_selected_list_label(self, locator: WebElement):
         selected_labels = self.b.get_selected_options(locator, SelectAttribute.label)
@@ -1453,40 +1858,70 @@ class SLtoB:
             raise e
 
     def _get_cell_text(self, locator: WebElement, row, column):
-        rows = self._get_rows(locator, row)
+        rows = self._get_table_rows(locator)
         if len(rows) < abs(row):
             raise AssertionError(
                 f"Table '{locator.original_locator}' should have had at least {abs(row)} "
                 f"rows but had only {len(rows)}."
             )
-        index = row - 1 if row > 0 else row
-        if column < 0:
-            column_cnt = self.b.get_element_count(f"{rows[index]} >> xpath=./th|./td") + column
-            if column_cnt < 0:
-                raise AssertionError(
-                    f"Table '{locator.original_locator}' should have had at least {abs(column)} "
-                    f"columns but had only {column_cnt}."
-                )
-        else:
-            column_cnt = column - 1
-        cell_cnt = self.b.get_element_count(f"{rows[index]} >> xpath=./th|./td")
-        if cell_cnt < abs(column):
+        cells = rows[row - 1 if row > 0 else row]["cells"]
+        if len(cells) < abs(column):
             raise AssertionError(
                 f"Table '{locator.original_locator}' row {row} should have had at "
-                f"least {abs(column)} columns but had only {cell_cnt}."
+                f"least {abs(column)} columns but had only {len(cells)}."
             )
-        return self.b.get_text(f"{rows[index]} >> xpath=./th|./td >> nth={column_cnt}")
+        return cells[column - 1 if column > 0 else column]
+
+    @keyword(tags=("IMPLEMENTED",))
+    def get_table_data(self, locator: WebElement) -> List[DotDict]:
+        """Returns all rows of the table ``locator`` with one call to the browser.
 
-    def _get_rows(self, locator, count):
-        cnt = self.b.get_element_count(f"{locator} >> thead > tr")
-        rows = [f"{locator} >> thead > tr >> nth={index}" for index in range(cnt)]
-        if count < 0 or len(rows) < count:
-            cnt = self.b.get_element_count(f"{locator} >> tbody > tr")
-            rows.extend([f"{locator} >> tbody > tr >> nth={index}" for index in range(cnt)])
-        if count < 0 or len(rows) < count:
-            cnt = self.b.get_element_count(f"{locator} >> tfoot > tr")
-            rows.extend([f"{locator} >> tfoot > tr >> nth={index}" for index in range(cnt)])
-        return rows
+        Each row is a dictionary with the ``section`` (``thead``, ``tbody`` or ``tfoot``)
+        the row belongs to and the texts of its ``cells``.
+        Rows are ordered like `Get Table Cell` counts them: header rows first, then body rows
+        and the footer rows last. Texts of nested tables are part of the text of the cell
+        that contains them.
+
+        Example:
+        | ${rows} =    `Get Table Data`    id:results
+        | `Should Be Equal`    ${rows}[0][section]    thead
+        | `Should Be Equal`    ${rows}[1][cells][2]    Passed
+        """
+        return [
+            DotDict(section=row["section"], cells=row["cells"])
+            for row in self._get_table_rows(locator)
+        ]
+
+    def _get_table_rows(self, locator: WebElement) -> List[dict]:
+        return [row for row in self._get_table_matrix(locator) if row["table"] == 0]
+
+    def _get_table_matrix(self, locator: WebElement) -> List[dict]:
+        """Extracts the table and all tables nested in it as one list of rows.
+
+        Every row knows the index of the ``table`` it belongs to (``0`` is the table
+        itself), its ``section``, the text of its ``cells`` and which of them are ``th``.
+        """
+        matrix = self.b.evaluate_javascript(
+            locator,
+            "tables => {",
+            "    if (!tables.length) return [];",
+            "    const rows = [];",
+            "    [tables[0], ...tables[0].querySelectorAll('table')].forEach((table, index) => {",
+            "        for (const row of table.rows) {",
+            "            const section = row.parentElement.nodeName.toLowerCase();",
+            "            rows.push({",
+            "                table: index,",
+            "                section: ['thead', 'tfoot'].includes(section) ? section : 'tbody',",
+            "                cells: Array.from(row.cells, cell => cell.innerText),",
+            "                th: Array.from(row.cells, cell => cell.nodeName === 'TH'),",
+            "            });",
+            "        }",
+            "    });",
+            "    return rows;",
+            "}",
+            all_elements=True,
+        )
+        return matrix or []
 
     @keyword(tags=("IMPLEMENTED",))
     def get_text(self, locator: WebElement):
@@ -1507,11 +1942,7 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def get_vertical_position(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        return self.b.get_boundingbox(locator, BoundingBoxFields.y)
+        return self._get_element_bbox(locator)["y"]
 
     @keyword(tags=("IMPLEMENTED",))
     def get_webelement(self, locator: WebElement):
@@ -1539,29 +1970,11 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def get_window_identifiers(self, browser: str = "CURRENT"):
-        current_page = self._get_current_page_id()
-        try:
-            return list(self._generate_window_ids(browser))
-        finally:
-            self.b.switch_page(current_page, context=SelectionType.ALL, browser=SelectionType.ALL)
-
-    def _generate_window_ids(self, browser: str):
-        for page_id in self._get_page_ids(browser):
-            self.b.switch_page(page_id, context=SelectionType.ALL, browser=SelectionType.ALL)
-            yield self.b.evaluate_javascript(None, "() => String(window.id)") or "undefined"
+        return self._get_window_properties(browser, "() => String(window.id)")
 
     @keyword(tags=("IMPLEMENTED",))
     def get_window_names(self, browser: str = "CURRENT"):
-        current_page = self._get_current_page_id()
-        try:
-            return list(self._generate_window_names(browser))
-        finally:
-            self.b.switch_page(current_page, context=SelectionType.ALL, browser=SelectionType.ALL)
-
-    def _generate_window_names(self, browser: str):
-        for page_id in self._get_page_ids(browser):
-            self.b.switch_page(page_id, context=SelectionType.ALL, browser=SelectionType.ALL)
-            yield self.b.evaluate_javascript(None, "() => String(window.name)") or "undefined"
+        return self._get_window_properties(browser, "() => String(window.name)")
 
     @keyword(tags=("IMPLEMENTED",))
     def get_window_position(self):
@@ -1576,16 +1989,7 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def get_window_titles(self, browser: str = "CURRENT"):
-        current_page = self._get_current_page_id()
-        try:
-            return list(self._generate_titles(browser))
-        finally:
-            self.b.switch_page(current_page, context=SelectionType.ALL, browser=SelectionType.ALL)
-
-    def _generate_titles(self, browser: str):
-        for page_id in self._get_page_ids(browser):
-            self.b.switch_page(page_id, context=SelectionType.ALL, browser=SelectionType.ALL)
-            yield self.b.get_title()
+        return [page["title"] for page in self._get_pages(browser)]
 
     def _get_current_page_id(self):
         return self.b.get_page_ids(
@@ -1610,16 +2014,49 @@ class SLtoB:
         ...
 
     @keyword(tags=("IMPLEMENTED",))
-    def input_password(self, locator: WebElement, password: str, clear: bool = True):
+    def input_password(
+        self,
+        locator: WebElement,
+        password: str,
+        clear: bool = True,
+        *,
+        strategy: Optional[InputStrategy] = None,
+    ):
         org_level = BuiltIn().set_log_level(level="NONE")
         try:
-            self.b.press_keys(locator, "End")
-            self.input_text(locator, password, clear)
+            if (strategy or self.input_strategy) != InputStrategy.fill:
+                self.b.press_keys(locator, "End")
+            self.input_text(locator, password, clear, strategy=strategy)
         finally:
             BuiltIn().set_log_level(level=org_level)
 
     @keyword(tags=("IMPLEMENTED",))
-    def input_text(self, locator: WebElement, text: str, clear: bool = True):
+    def input_text(
+        self,
+        locator: WebElement,
+        text: str,
+        clear: bool = True,
+        *,
+        strategy: Optional[InputStrategy] = None,
+    ):
+        """Types the given ``text`` into the text field identified by ``locator``.
+
+        If ``clear`` is true, the field is cleared first, otherwise the text is appended.
+        With ``strategy`` set to ``fill``, the value is set with one call, which
+        fires ``input`` and ``change`` events but no key events.
+        Elements that cannot be filled, like disabled fields, are typed into instead,
+        which reports the same errors.
+        ``type`` enters the text key by key.
+        The default is set with ``input_strategy`` in `Importing`.
+        """
+        if (strategy or self.input_strategy) == InputStrategy.fill:
+            status = self.b.evaluate_javascript(
+                locator, FAST_FILL, arg={"text": text, "clear": clear}
+            )
+            if status == "file":
+                return self.choose_file(locator, text)
+            if status == "filled":
+                return None
         if self.b.get_property(locator, "nodeName") == "INPUT":
             try:
                 is_file = self.b.get_attribute(locator, "type").lower() == "file"
@@ -1643,12 +2080,13 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def list_selection_should_be(self, locator: WebElement, *expected: str):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound("Page should have contained list 'nonexisting' but did not.")
-        selected_labels = self.b.get_selected_options(locator, SelectAttribute.label)
-        selected_values = self.b.get_selected_options(locator, SelectAttribute.value)
+        selected = self._evaluate_on_element(
+            locator,
+            "select => Array.from(select.selectedOptions, option => [option.label, option.value])",
+            error="Page should have contained list 'nonexisting' but did not.",
+        )
+        selected_labels = [label for label, _ in selected]
+        selected_values = [value for _, value in selected]
         expected_str = " | ".join(expected)
         actual_str = " | ".join(
             [f"{label} ({value})" for label, value in zip(selected_labels, selected_values)]
@@ -1694,7 +2132,10 @@ class SLtoB:
         if loglevel.upper() == "NONE":
             return None
         source = self.b.get_page_source()
-        logger.write(source, level=loglevel)
+        if self.page_sources.active:
+            self.page_sources.log(source, loglevel, self.log_dir)
+        else:
+            logger.write(source, level=loglevel)
         return source
 
     @keyword(tags=("IMPLEMENTED",))
@@ -1709,11 +2150,8 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def mouse_down(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        self.b.hover(locator)
+        with self._element_must_exist(locator):
+            self.b.hover(locator)
         self.b.mouse_button(MouseButtonAction.down)
 
     @keyword(tags=("IMPLEMENTED",))
@@ -1728,29 +2166,20 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def mouse_out(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
+        with self._element_must_exist(locator):
+            self.b.hover(locator)
         bbox = self.b.get_boundingbox(locator, BoundingBoxFields.ALL)
-        self.b.hover(locator)
         self.b.mouse_move_relative_to(locator, bbox.width / 2 + 1, bbox.height / 2 + 1, steps=10)
 
     @keyword(tags=("IMPLEMENTED",))
     def mouse_over(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        self.b.hover(locator)
+        with self._element_must_exist(locator):
+            self.b.hover(locator)
 
     @keyword(tags=("IMPLEMENTED",))
     def mouse_up(self, locator: WebElement):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        self.b.hover(locator)
+        with self._element_must_exist(locator):
+            self.b.hover(locator)
         self.b.mouse_button(MouseButtonAction.up)
 
     @keyword(tags=("IMPLEMENTED",))
@@ -1785,7 +2214,7 @@ class SLtoB:
         )
         identifier = next(self._browser_index)
         self._context_indexes[identifier] = context_id
-        self._context_page_catalog[context_id] = [page_info["page_id"]]
+        self._context_page_catalog.add_context(context_id, [page_info["page_id"]])
         if alias:
             self._context_aliases[alias] = identifier
         return identifier
@@ -1796,9 +2225,7 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def page_should_contain(self, text: str, loglevel: str = "TRACE"):
-        assert self.page_contains(
-            f"text={text}"
-        ), f"Page should have contained text '{text}' but did not."
+        assert self.page_contains(text), f"Page should have contained text '{text}' but did not."
 
     @keyword(tags=("IMPLEMENTED",))
     def page_should_contain_button(
@@ -1808,8 +2235,8 @@ class SLtoB:
         loglevel: str = "TRACE",
     ):
         locator = self.get_button_locator(locator)
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") in ["INPUT", "BUTTON"]:
+        for node, _ in self._get_element_types(locator):
+            if node in ["INPUT", "BUTTON"]:
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1824,12 +2251,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        elements = self.b.get_elements(locator)
-        for element in elements:
-            if (
-                self.b.get_attribute(element, "type").lower() == "checkbox"
-                and self.b.get_property(element, "nodeName") == "INPUT"
-            ):
+        for node, type_ in self._get_element_types(locator):
+            if type_ == "checkbox" and node == "INPUT":
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1874,8 +2297,8 @@ class SLtoB:
         loglevel: str = "TRACE",
     ):
         locator = self.get_image_locator(locator)
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "IMG":
+        for node, _ in self._get_element_types(locator):
+            if node == "IMG":
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1890,8 +2313,8 @@ class SLtoB:
         loglevel: str = "TRACE",
     ):
         locator = self.get_link_locator(locator)
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "A":
+        for node, _ in self._get_element_types(locator):
+            if node == "A":
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1905,8 +2328,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "SELECT":
+        for node, _ in self._get_element_types(locator):
+            if node == "SELECT":
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1920,11 +2343,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if (
-                self.b.get_attribute(element, "type").lower() == "radio"
-                and self.b.get_property(element, "nodeName") == "INPUT"
-            ):
+        for node, type_ in self._get_element_types(locator):
+            if type_ == "radio" and node == "INPUT":
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1939,24 +2359,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "INPUT" and self.b.get_attribute(
-                element, "type"
-            ).lower() in [
-                "date",
-                "datetime-local",
-                "email",
-                "month",
-                "number",
-                "password",
-                "search",
-                "tel",
-                "text",
-                "time",
-                "url",
-                "week",
-                "file",
-            ]:
+        for node, type_ in self._get_element_types(locator):
+            if node == "INPUT" and type_ in TEXTFIELD_TYPES:
                 return
         self.log_source(loglevel)
         raise AssertionError(
@@ -1967,9 +2371,7 @@ class SLtoB:
     @keyword(tags=("IMPLEMENTED",))
     def page_should_not_contain(self, text: str, loglevel: str = "TRACE"):
         try:
-            assert not self.page_contains(
-                f"text={text}"
-            ), f"Page should not have contained text '{text}'."
+            assert not self.page_contains(text), f"Page should not have contained text '{text}'."
         except AssertionError as e:
             self.log_source(loglevel)
             raise e
@@ -1982,8 +2384,7 @@ class SLtoB:
         loglevel: str = "TRACE",
     ):
         locator = self.get_button_locator(locator)
-        for element in self.b.get_elements(locator):
-            node = self.b.get_property(element, "nodeName")
+        for node, _ in self._get_element_types(locator):
             if node == "INPUT":
                 self.log_source(loglevel)
                 raise AssertionError(
@@ -2003,11 +2404,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if (
-                self.b.get_attribute(element, "type").lower() == "checkbox"
-                and self.b.get_property(element, "nodeName") == "INPUT"
-            ):
+        for node, type_ in self._get_element_types(locator):
+            if type_ == "checkbox" and node == "INPUT":
                 self.log_source(loglevel)
                 raise AssertionError(
                     message
@@ -2035,8 +2433,8 @@ class SLtoB:
         loglevel: str = "TRACE",
     ):
         locator = self.get_image_locator(locator)
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "IMG":
+        for node, _ in self._get_element_types(locator):
+            if node == "IMG":
                 self.log_source(loglevel)
                 raise AssertionError(
                     message or f"Page should not have contained image '{locator.original_locator}'."
@@ -2050,8 +2448,8 @@ class SLtoB:
         loglevel: str = "TRACE",
     ):
         locator = self.get_link_locator(locator)
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "A":
+        for node, _ in self._get_element_types(locator):
+            if node == "A":
                 self.log_source(loglevel)
                 raise AssertionError(
                     message or f"Page should not have contained link '{locator.original_locator}'."
@@ -2064,8 +2462,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "SELECT":
+        for node, _ in self._get_element_types(locator):
+            if node == "SELECT":
                 self.log_source(loglevel)
                 raise AssertionError(
                     message or f"Page should not have contained list '{locator.original_locator}'."
@@ -2078,11 +2476,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if (
-                self.b.get_attribute(element, "type").lower() == "radio"
-                and self.b.get_property(element, "nodeName") == "INPUT"
-            ):
+        for node, type_ in self._get_element_types(locator):
+            if type_ == "radio" and node == "INPUT":
                 self.log_source(loglevel)
                 raise AssertionError(
                     message
@@ -2096,24 +2491,8 @@ class SLtoB:
         message: Optional[str] = None,
         loglevel: str = "TRACE",
     ):
-        for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "INPUT" and self.b.get_attribute(
-                element, "type"
-            ).lower() in [
-                "date",
-                "datetime-local",
-                "email",
-                "month",
-                "number",
-                "password",
-                "search",
-                "tel",
-                "text",
-                "time",
-                "url",
-                "week",
-                "file",
-            ]:
+        for node, type_ in self._get_element_types(locator):
+            if node == "INPUT" and type_ in TEXTFIELD_TYPES:
                 self.log_source(loglevel)
                 raise AssertionError(
                     message
@@ -2124,12 +2503,9 @@ class SLtoB:
     def press_key(self, locator: WebElement, key: str):
         if key.startswith("\\") and len(key) > 1:
             key = self._map_ascii_key_code_to_key(int(key[1:]))
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
         if isinstance(key, Keys):
-            self.b.keyboard_key(KeyAction.press, key.value)
+            with self._element_must_exist(locator):
+                self.b.press_keys(locator, key.value)
         else:
             self.press_keys(locator, key)
 
@@ -2160,36 +2536,41 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def press_keys(self, locator: Optional[WebElement] = None, *keys: str):
-        parsed_keys = self._parse_keys(keys)
+        key_plan = self._get_key_plan(keys)
         if not self._is_noney(locator):
             logger.info(f"Sending key(s) {keys} to {locator.original_locator} element.")
-            try:
-                self.b.get_element_states(locator, CONTAINS, "attached")
-            except AssertionError:
-                raise ElementNotFound(
-                    f"Element with locator '{locator.original_locator}' not found."
-                )
-            self.b.click(
-                locator
-            )  # ToDo: i would consider this a bug. it should focus; not click...
+            with self._element_must_exist(locator):
+                self.b.click(
+                    locator
+                )  # ToDo: i would consider this a bug. it should focus; not click...
         else:
             logger.info(f"Sending key(s) {keys} to page.")
-        for parsed_key in parsed_keys:
+        for action, value in key_plan:
+            if action is KeyboardInputAction.type:
+                self.b.keyboard_input(action, value)
+            else:
+                self.b.keyboard_key(action, value)
+
+    def _build_key_plan(self, keys: Tuple[str, ...]) -> Tuple[Tuple[Enum, str], ...]:
+        """Converts the keys of `Press Keys` into the calls that send them.
+
+        Runs of plain characters are typed with one call, only special keys are pressed
+        down and released separately. Depends only on ``keys``, so ``_get_key_plan``
+        caches it per keys tuple.
+        """
+        steps = []
+        for parsed_key in self._parse_keys(keys):
             for key in parsed_key:
                 if key.special:
-                    self.b.keyboard_key(KeyAction.down, key.converted.value)
+                    steps.append((KeyAction.down, key.converted.value))
+                elif steps and steps[-1][0] is KeyboardInputAction.type:
+                    steps[-1] = (KeyboardInputAction.type, steps[-1][1] + key.converted)
                 else:
-                    for char in key.converted:
-                        try:
-                            self.b.keyboard_key(KeyAction.press, char)
-                        except Exception:
-                            self.b.keyboard_input(KeyboardInputAction.type, char)
-            self._special_key_up(None, parsed_key)
-
-    def _special_key_up(self, actions, parsed_key):
-        for key in reversed(parsed_key):
-            if key.special:
-                self.b.keyboard_key(KeyAction.up, key.converted.value)
+                    steps.append((KeyboardInputAction.type, key.converted))
+            steps.extend(
+                (KeyAction.up, key.converted.value) for key in reversed(parsed_key) if key.special
+            )
+        return tuple(steps)
 
     def _is_noney(self, item):
         return (
@@ -2220,7 +2601,6 @@ class SLtoB:
         return list_keys
 
     def _convert_special_keys(self, keys):
-        KeysRecord = namedtuple("KeysRecord", "converted, original special")
         converted_keys = []
         for key in keys:
             ky = self._parse_aliases(key)
@@ -2331,7 +2711,8 @@ class SLtoB:
             raise NoSuchFrameException(
                 f"Message: Unable to locate frame for element: {self.b.get_url()}"
             )
-        self.b.set_selector_prefix(f"{locator} >>>", scope=Scope.Global)
+        self._frame_stack.append(str(locator))
+        self._set_selector_prefix(" >>> ".join(self._frame_stack) + " >>>")
 
     @keyword(tags=("IMPLEMENTED",))
     def select_from_list_by_index(self, locator: WebElement, *indexes: str):
@@ -2429,17 +2810,13 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def simulate_event(self, locator: WebElement, event: str):
-        try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
-        except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
         script = """(element, eventName) => {
                 var evt = document.createEvent("HTMLEvents");
                 evt.initEvent(eventName, true, true);
                 return !element.dispatchEvent(evt);
             }
         """
-        self.b.evaluate_javascript(locator, script, arg=event)
+        self._evaluate_on_element(locator, script, event)
 
     @keyword(tags=("IMPLEMENTED",))
     def submit_form(self, locator: Optional[WebElement] = None):
@@ -2472,72 +2849,98 @@ class SLtoB:
     ):
         log_level = BuiltIn().set_log_level("ERROR")
         try:
-            epoch = time.time()
-            timeout = epoch if not timeout else timestr_to_secs(timeout) + epoch
             current_page_id = self._get_current_page_id()
-            while True:
-                try:
-                    if isinstance(locator, str):
-                        if locator.upper() == "CURRENT":
-                            return current_page_id
-                        if locator.upper() == "NEW":
-                            ctx_id = self._get_pw_context_id(browser)
-                            self.b.switch_page("NEW", context=ctx_id, browser=SelectionType.ALL)
-                            return current_page_id
-                        locator_match = re.match(
-                            r"(?P<strategy>name|title|url|default)[:=](?P<locator>.*)", locator
-                        )
-                        if locator_match:
-                            locator = locator_match.group("locator")
-                            strategy = locator_match.group("strategy")
-                        else:
-                            strategy = "default"
-                        for index, page_info in enumerate(
-                            self._generate_window_information(browser)
-                        ):
-                            if strategy == "default" and page_info["handle"] == locator:
-                                return current_page_id
-                            if strategy in ["default", "name"] and page_info["name"] == locator:
-                                return current_page_id
-                            if strategy in ["default", "title"] and page_info["title"] == locator:
-                                return current_page_id
-                            if strategy in ["default", "url"] and page_info["url"] == locator:
-                                return current_page_id
-                            if strategy == "default" and locator.upper() == "MAIN" and index == 0:
-                                return current_page_id
-                        self.b.switch_page(current_page_id)
-                    else:
-                        for page_id in self._get_page_ids(browser):
-                            if page_id not in locator:
-                                self.b.switch_page(page_id, SelectionType.ALL, SelectionType.ALL)
-                                return current_page_id
-                    raise WindowNotFound(
-                        f"No window matching handle, name, title or URL '{locator}' found."
+
+            def attempt():
+                nonlocal locator
+                if isinstance(locator, str):
+                    if locator.upper() == "CURRENT":
+                        return current_page_id
+                    if locator.upper() == "NEW":
+                        ctx_id = self._get_pw_context_id(browser)
+                        self.b.switch_page("NEW", context=ctx_id, browser=SelectionType.ALL)
+                        return current_page_id
+                    locator_match = re.match(
+                        r"(?P<strategy>name|title|url|default)[:=](?P<locator>.*)", locator
                     )
-                except WindowNotFound as e:
-                    if time.time() > timeout:
-                        raise e
-                    time.sleep(0.1)
+                    if locator_match:
+                        locator = locator_match.group("locator")
+                        strategy = locator_match.group("strategy")
+                    else:
+                        strategy = "default"
+                    pages = self._get_pages(browser)
+                    if self._switch_to_matching_window(pages, strategy, locator, current_page_id):
+                        return current_page_id
+                else:
+                    for page_id in self._get_page_ids(browser):
+                        if page_id not in locator:
+                            self.b.switch_page(page_id, SelectionType.ALL, SelectionType.ALL)
+                            return current_page_id
+                raise WindowNotFound(
+                    f"No window matching handle, name, title or URL '{locator}' found."
+                )
+
+            return self.polling.poll(
+                attempt,
+                timestr_to_secs(timeout) if timeout else 0,
+                "switch_window",
+                retry_on=(WindowNotFound,),
+                defer_log=True,
+            )
         finally:
             BuiltIn().set_log_level(log_level)
+            self.polling.flush_log()
+
+    def _switch_to_matching_window(
+        self, pages: List[Dict[str, Any]], strategy: str, locator: str, current_page_id: str
+    ) -> bool:
+        """Switches to the first page matching ``locator`` and returns whether one was found.
+
+        Each page is checked by handle, name, title and URL before the next page. Handles, titles
+        and URLs are part of the browser catalog, window names are only read from the pages
+        before the first page matching one of them.
+        """
+        match = next(
+            (
+                index
+                for index, page in enumerate(pages)
+                if self._window_matches(page, index, strategy, locator)
+            ),
+            None,
+        )
+        active_page = current_page_id
+        if strategy in ["default", "name"]:
+            candidates = pages if match is None else pages[:match]
+            function = "() => String(window.name)"
+            for page_id, name in self._evaluate_in_pages(candidates, function, current_page_id):
+                active_page = page_id
+                if name == locator:
+                    return True
+        target = current_page_id if match is None else pages[match]["id"]
+        if target != active_page:
+            self.b.switch_page(target, SelectionType.ALL, SelectionType.ALL)
+        return match is not None
 
-    def _generate_window_information(self, browser: str):
-        for page_id in self._get_page_ids(browser):
-            self.b.switch_page(page_id, context=SelectionType.ALL, browser=SelectionType.ALL)
-            name = self.b.evaluate_javascript(None, "() => String(window.name)")
-            title = self.b.get_title()
-            url = self.b.get_url()
-            handle = page_id
-            yield {"handle": handle, "name": name, "title": title, "url": url}
+    @staticmethod
+    def _window_matches(page: Dict[str, Any], index: int, strategy: str, locator: str) -> bool:
+        return (
+            (strategy == "default" and page["id"] == locator)
+            or (strategy in ["default", "title"] and page["title"] == locator)
+            or (strategy in ["default", "url"] and page["url"] == locator)
+            or (strategy == "default" and locator.upper() == "MAIN" and index == 0)
+        )
 
-    def _index_to_position(self, index):
+    @staticmethod
+    def _validate_index(index: int):
         if index == 0:
             raise ValueError("Row and column indexes must be non-zero.")
-        if index > 0:
-            return str(index)
-        if index == -1:
-            return "position()=last()"
-        return f"position()=last()-{abs(index) - 1}"
+
+    @staticmethod
+    def _get_by_index(items: list, index: int):
+        try:
+            return items[index - 1 if index > 0 else index]
+        except IndexError:
+            return None
 
     @keyword(tags=("IMPLEMENTED",))
     def table_cell_should_contain(
@@ -2565,17 +2968,15 @@ class SLtoB:
         expected: str,
         loglevel: str = "TRACE",
     ):
-        position = self._index_to_position(column)
-        if (
-            self.b.get_element_count(
-                f"{locator} >> //tr//*[self::td or self::th][{position}] >> text={expected}"
-            )
-            == 0
-        ):
-            self.log_source(loglevel)
-            raise AssertionError(
-                f"Table '{locator.original_locator}' column {column} did not contain text '{expected}'."
-            )
+        self._validate_index(column)
+        for row in self._get_table_matrix(locator):
+            cell = self._get_by_index(row["cells"], column)
+            if cell is not None and expected in cell:
+                return
+        self.log_source(loglevel)
+        raise AssertionError(
+            f"Table '{locator.original_locator}' column {column} did not contain text '{expected}'."
+        )
 
     @keyword(tags=("IMPLEMENTED",))
     def table_footer_should_contain(
@@ -2584,11 +2985,16 @@ class SLtoB:
         expected: str,
         loglevel: str = "TRACE",
     ):
-        if self.b.get_element_count(f"{locator} >> //tfoot//td >> text={expected}") == 0:
-            self.log_source(loglevel)
-            raise AssertionError(
-                f"Table '{locator.original_locator}' footer did not contain text '{expected}'."
-            )
+        for row in self._get_table_matrix(locator):
+            if row["section"] != "tfoot":
+                continue
+            for cell, is_th in zip(row["cells"], row["th"]):
+                if not is_th and expected in cell:
+                    return
+        self.log_source(loglevel)
+        raise AssertionError(
+            f"Table '{locator.original_locator}' footer did not contain text '{expected}'."
+        )
 
     @keyword(tags=("IMPLEMENTED",))
     def table_header_should_contain(
@@ -2597,9 +3003,10 @@ class SLtoB:
         expected: str,
         loglevel: str = "TRACE",
     ):
-        for i in range(self.b.get_element_count(f"{locator} >> //th")):
-            if expected in self.b.get_text(f"{locator} >> //th >> nth={i}"):
-                return
+        for row in self._get_table_matrix(locator):
+            for cell, is_th in zip(row["cells"], row["th"]):
+                if is_th and expected in cell:
+                    return
         self.log_source(loglevel)
         raise AssertionError(
             f"Table '{locator.original_locator}' header did not contain text '{expected}'."
@@ -2613,9 +3020,13 @@ class SLtoB:
         expected: str,
         loglevel: str = "TRACE",
     ):
-        position = self._index_to_position(row)
-        for i in range(self.b.get_element_count(f"{locator} >> //tr[{position}]")):
-            if expected in self.b.get_text(f"{locator} >> //tr[{position}] >> nth={i}").replace(
+        self._validate_index(row)
+        sections = {}
+        for table_row in self._get_table_matrix(locator):
+            sections.setdefault((table_row["table"], table_row["section"]), []).append(table_row)
+        for rows in sections.values():
+            table_row = self._get_by_index(rows, row)
+            if table_row is not None and expected in " ".join(table_row["cells"]).replace(
                 "\t", " "
             ):
                 return
@@ -2631,11 +3042,13 @@ class SLtoB:
         expected: str,
         loglevel: str = "TRACE",
     ):
-        if self.b.get_element_count(f"{locator} >> text={expected}") == 0:
-            self.log_source(loglevel)
-            raise AssertionError(
-                f"Table '{locator.original_locator}' did not contain text '{expected}'."
-            )
+        for row in self._get_table_rows(locator):
+            if any(expected in cell for cell in row["cells"]):
+                return
+        self.log_source(loglevel)
+        raise AssertionError(
+            f"Table '{locator.original_locator}' did not contain text '{expected}'."
+        )
 
     @keyword(tags=("IMPLEMENTED",))
     def textarea_should_contain(
@@ -2686,23 +3099,10 @@ class SLtoB:
         message: Optional[str] = None,
     ):
         for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "INPUT" and self.b.get_attribute(
-                element, "type"
-            ).lower() in [
-                "date",
-                "datetime-local",
-                "email",
-                "month",
-                "number",
-                "password",
-                "search",
-                "tel",
-                "text",
-                "time",
-                "url",
-                "week",
-                "file",
-            ]:
+            if (
+                self.b.get_property(element, "nodeName") == "INPUT"
+                and self.b.get_attribute(element, "type").lower() in TEXTFIELD_TYPES
+            ):
                 text = self.b.get_text(locator)
                 if expected not in text:
                     raise AssertionError(
@@ -2720,23 +3120,10 @@ class SLtoB:
         message: Optional[str] = None,
     ):
         for element in self.b.get_elements(locator):
-            if self.b.get_property(element, "nodeName") == "INPUT" and self.b.get_attribute(
-                element, "type"
-            ).lower() in [
-                "date",
-                "datetime-local",
-                "email",
-                "month",
-                "number",
-                "password",
-                "search",
-                "tel",
-                "text",
-                "time",
-                "url",
-                "week",
-                "file",
-            ]:
+            if (
+                self.b.get_property(element, "nodeName") == "INPUT"
+                and self.b.get_attribute(element, "type").lower() in TEXTFIELD_TYPES
+            ):
                 text = self.b.get_text(locator)
                 if text != expected:
                     raise AssertionError(
@@ -2769,7 +3156,13 @@ class SLtoB:
 
     @keyword(tags=("IMPLEMENTED",))
     def unselect_frame(self):
-        self.b.set_selector_prefix("", scope=Scope.Global)
+        self._frame_stack.clear()
+        self._set_selector_prefix("")
+
+    def _set_selector_prefix(self, prefix: str):
+        """Sets the global selector prefix of Browser only if it differs from the current one."""
+        if (self.b.selector_prefix or "") != prefix:
+            self.b.set_selector_prefix(prefix, scope=Scope.Global)
 
     @keyword(tags=("IMPLEMENTED",))
     def unselect_from_list_by_index(self, locator: WebElement, *indexes: str):
@@ -2826,8 +3219,9 @@ class SLtoB:
         timeout = self.timeout if timeout is None else timeout
         if "return" not in condition:
             raise ValueError(f"Condition '{condition}' did not have mandatory 'return'.")
-        self._wait_until(
-            lambda: self.execute_javascript(condition) is True,
+        javascript, _ = self._analyse_js((condition,))
+        self._wait_until_function(
+            f"() => ((arguments) => {{{javascript}}})() === true",
             f"Condition '{condition}' did not become true in <TIMEOUT>.",
             timeout,
             error,
@@ -2843,6 +3237,7 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         self._wait_until(
+            "wait_until_element_contains",
             lambda: text in self.b.get_text(locator),
             f"Element '{locator.original_locator}' did not get text '{text}' in <TIMEOUT>.",
             timeout,
@@ -2859,6 +3254,7 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         self._wait_until(
+            "wait_until_element_does_not_contain",
             lambda: text not in self.b.get_text(locator),
             f"Element '{locator.original_locator}' still had text '{text}' after <TIMEOUT>.",
             timeout,
@@ -2874,17 +3270,19 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         try:
-            self.b.get_element_states(locator, CONTAINS, "attached")
+            self._wait_until_state(
+                locator,
+                ElementState.editable,
+                f"Element '{locator.original_locator}' was not enabled in <TIMEOUT>.",
+                timeout,
+                error,
+            )
         except AssertionError:
-            raise ElementNotFound(f"Element with locator '{locator.original_locator}' not found.")
-        self._wait_until(
-            lambda: self.b.get_element_states(
-                locator, THEN, "bool((value & (enabled | editable)) == (enabled | editable))"
-            ),
-            f"Element '{locator.original_locator}' was not enabled in <TIMEOUT>.",
-            timeout,
-            error,
-        )
+            if not self.b.get_element_count(locator):
+                raise ElementNotFound(
+                    f"Element with locator '{locator.original_locator}' not found."
+                )
+            raise
 
     @keyword(tags=("IMPLEMENTED",))
     def wait_until_element_is_not_visible(
@@ -2894,8 +3292,9 @@ class SLtoB:
         error: Optional[str] = None,
     ):
         timeout = self.timeout if timeout is None else timeout
-        self._wait_until(
-            lambda: self.b.get_element_states(locator, THEN, "bool(value & (hidden | detached))"),
+        self._wait_until_state(
+            locator,
+            ElementState.hidden,
             f"Element '{locator.original_locator}' still visible after <TIMEOUT>.",
             timeout,
             error,
@@ -2909,8 +3308,9 @@ class SLtoB:
         error: Optional[str] = None,
     ):
         timeout = self.timeout if timeout is None else timeout
-        self._wait_until(
-            lambda: self.b.get_element_states(locator, THEN, "bool(value & visible)"),
+        self._wait_until_state(
+            locator,
+            ElementState.visible,
             f"Element '{locator.original_locator}' not visible after <TIMEOUT>.",
             timeout,
             error,
@@ -2924,8 +3324,8 @@ class SLtoB:
         message: Optional[str] = None,
     ):
         timeout = self.timeout if timeout is None else timeout
-        self._wait_until(
-            lambda: expected in self.b.get_url(),
+        self._wait_until_function(
+            f"() => window.location.href.includes({json.dumps(expected)})",
             f"Location did not contain '{expected}' in <TIMEOUT>.",
             timeout,
             message,
@@ -2939,8 +3339,8 @@ class SLtoB:
         message: Optional[str] = None,
     ):
         timeout = self.timeout if timeout is None else timeout
-        self._wait_until(
-            lambda: location not in self.b.get_url(),
+        self._wait_until_function(
+            f"() => !window.location.href.includes({json.dumps(location)})",
             f"Location did contain '{location}' in <TIMEOUT>.",
             timeout,
             message,
@@ -2954,8 +3354,8 @@ class SLtoB:
         message: Optional[str] = None,
     ):
         timeout = self.timeout if timeout is None else timeout
-        self._wait_until(
-            lambda: expected == self.b.get_url(),
+        self._wait_until_function(
+            f"() => window.location.href === {json.dumps(expected)}",
             f"Location did not become '{expected}' in <TIMEOUT>.",
             timeout,
             message,
@@ -2969,8 +3369,8 @@ class SLtoB:
         message: Optional[str] = None,
     ):
         timeout = self.timeout if timeout is None else timeout
-        self._wait_until(
-            lambda: location != self.b.get_url(),
+        self._wait_until_function(
+            f"() => window.location.href !== {json.dumps(location)}",
             f"Location is '{location}' in <TIMEOUT>.",
             timeout,
             message,
@@ -2985,7 +3385,8 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         self._wait_until(
-            lambda: self.page_contains(f"text={text}"),
+            "wait_until_page_contains",
+            lambda: self.page_contains(text),
             f"Text '{text}' did not appear in <TIMEOUT>.",
             timeout,
             error,
@@ -3001,20 +3402,18 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         if limit is None:
-
-            def func():
-                return self.b.get_element_count(locator) > 0
-
-            msg = f"Element '{locator.original_locator}' did not appear in <TIMEOUT>."
-        else:
-
-            def func():
-                return self.b.get_element_count(locator) == limit
-
-            msg = f'Page should have contained "{limit}" {locator.original_locator} element(s) within <TIMEOUT>.'
+            self._wait_until_state(
+                locator,
+                ElementState.attached,
+                f"Element '{locator.original_locator}' did not appear in <TIMEOUT>.",
+                timeout,
+                error,
+            )
+            return
         self._wait_until(
-            func,
-            msg,
+            "wait_until_page_contains_element",
+            lambda: self.b.get_element_count(locator) == limit,
+            f'Page should have contained "{limit}" {locator.original_locator} element(s) within <TIMEOUT>.',
             timeout,
             error,
         )
@@ -3028,7 +3427,8 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         self._wait_until(
-            lambda: not self.page_contains(f"text={text}"),
+            "wait_until_page_does_not_contain",
+            lambda: not self.page_contains(text),
             f"Text '{text}' did not disappear in <TIMEOUT>.",
             timeout,
             error,
@@ -3044,45 +3444,86 @@ class SLtoB:
     ):
         timeout = self.timeout if timeout is None else timeout
         if limit is None:
+            self._wait_until_state(
+                locator,
+                ElementState.detached,
+                f"Element '{locator.original_locator}' did not disappear in <TIMEOUT>.",
+                timeout,
+                error,
+            )
+            return
+        self._wait_until(
+            "wait_until_page_does_not_contain_element",
+            lambda: self.b.get_element_count(locator) != limit,
+            f'Page should have not contained "{limit}" {locator.original_locator} element(s) within <TIMEOUT>.',
+            timeout,
+            error,
+        )
 
-            def func():
-                return self.b.get_element_count(locator) == 0
-
-            msg = f"Element '{locator.original_locator}' did not disappear in <TIMEOUT>."
-        else:
-
-            def func():
-                return self.b.get_element_count(locator) != limit
+    def _wait_until(
+        self, name: str, condition, error, timeout: Optional[timedelta] = None, custom_error=None
+    ):
+        timeout, error = self._get_wait_timeout_and_error(error, timeout, custom_error)
+        self._wait_until_worker(name, condition, timeout, error)
 
-            msg = f'Page should have not contained "{limit}" {locator.original_locator} element(s) within <TIMEOUT>.'
-        self._wait_until(
-            func,
-            msg,
+    def _wait_until_state(
+        self,
+        locator: WebElement,
+        state: ElementState,
+        error,
+        timeout: Optional[timedelta] = None,
+        custom_error=None,
+    ):
+        self._wait_in_browser(
+            lambda to: self.b.wait_for_elements_state(locator, state, to),
+            error,
             timeout,
+            custom_error,
+        )
+
+    def _wait_until_function(
+        self, function: str, error, timeout: Optional[timedelta] = None, custom_error=None
+    ):
+        self._wait_in_browser(
+            lambda to: self.b.wait_for_function(function, polling=IN_PAGE_POLLING, timeout=to),
             error,
+            timeout,
+            custom_error,
         )
 
-    def _wait_until(self, condition, error, timeout: Optional[timedelta] = None, custom_error=None):
+    def _wait_in_browser(self, wait, error, timeout: Optional[timedelta] = None, custom_error=None):
+        """Hands the wait over to Playwright, which returns as soon as the condition is met.
+
+        Only a timeout is reported with ``error``, other errors like invalid selectors or
+        closed pages are raised as they are.
+        """
+        timeout, error = self._get_wait_timeout_and_error(error, timeout, custom_error)
+        try:
+            wait(timedelta(seconds=timeout))
+        except Exception as e:
+            if not PLAYWRIGHT_TIMEOUT.search(str(e)):
+                raise
+            raise AssertionError(error) from e
+
+    def _get_wait_timeout_and_error(self, error, timeout: Optional[timedelta], custom_error):
         timeout = self.b.get_timeout(timeout) / 1000
         if custom_error is None:
             error = error.replace("<TIMEOUT>", secs_to_timestr(timeout))
         else:
             error = custom_error
-        self._wait_until_worker(condition, timeout, error)
+        return timeout, error
 
-    def _wait_until_worker(self, condition, timeout, error):
-        max_time = time.time() + timeout
-        not_found = None
-        while time.time() < max_time:
-            try:
-                if condition():
-                    return
-            except Exception as err:
-                not_found = str(err)
-            else:
-                not_found = None
-            time.sleep(0.2)
-        raise AssertionError(not_found or error)
+    def _wait_until_worker(self, name: str, condition, timeout, error):
+        def attempt():
+            if not condition():
+                raise AssertionError(error)
+
+        try:
+            self.polling.poll(attempt, timeout, name)
+        except AssertionError:
+            raise
+        except Exception as err:
+            raise AssertionError(str(err)) from err
 
     def _create_directory(self, path):
         target_dir = Path(path).parent
@@ -3102,6 +3543,97 @@ class SLtoB:
         self._create_directory(path)
         return str(path)
 
+    def _take_screenshot(
+        self, filename: str, locator: Optional[WebElement] = None, deduplicate: bool = False
+    ) -> str:
+        if self._decide_embedded(filename):
+            if not deduplicate:
+                self.b.take_screenshot(filename=EMBED, selector=locator)
+                return EMBED
+            screenshot = self.b.take_screenshot(
+                filename=EMBED,
+                selector=locator,
+                log_screenshot=False,
+                return_as=ScreenshotReturnType.bytes,
+            )
+            if self._find_duplicate_screenshot(screenshot, EMBED) is None:
+                self._embed_screenshot(screenshot)
+            return EMBED
+        screenshot_file = re.sub(".png$", "", self._get_screenshot_path(filename, False))
+        writer = self.screenshot_writer
+        if writer is None and not deduplicate:
+            return self.b.take_screenshot(filename=screenshot_file, selector=locator)
+        staged, target = self._capture_screenshot_file(screenshot_file, locator)
+        duplicate = (
+            self._find_duplicate_screenshot(staged.read_bytes(), str(target))
+            if deduplicate
+            else None
+        )
+        if duplicate is not None:
+            if staged != Path(duplicate):
+                staged.unlink()
+            if writer is not None:
+                writer.release(target)
+            target = Path(duplicate)
+        elif writer is not None:
+            writer.submit(staged, target)
+        self._log_screenshot_link(str(target))
+        return str(target)
+
+    def _capture_screenshot_file(
+        self, screenshot_file: str, locator: Optional[WebElement]
+    ) -> Tuple[Path, Path]:
+        """Captures without logging and returns the captured file and its final path.
+
+        With the asynchronous writer, the final path is reserved and the capture goes to
+        the staging directory, otherwise both are the same.
+        """
+        writer = self.screenshot_writer
+        if writer is None:
+            staged = Path(
+                self.b.take_screenshot(
+                    filename=screenshot_file, selector=locator, log_screenshot=False
+                )
+            )
+            return staged, staged
+        target = writer.reserve(screenshot_file)
+        try:
+            staged = self.b.take_screenshot(
+                filename=str(writer.staging_path()), selector=locator, log_screenshot=False
+            )
+        except Exception:
+            writer.release(target)
+            raise
+        return Path(staged), target
+
+    def _find_duplicate_screenshot(self, screenshot: bytes, path: str) -> Optional[str]:
+        duplicate = self.failure_screenshots.find_duplicate(
+            self._get_current_page_id(), screenshot, path
+        )
+        if duplicate == EMBED:
+            logger.info("Screenshot is identical to the previous one of this page.")
+        elif duplicate is not None:
+            logger.info(f"Screenshot is identical to the previous one of this page: {duplicate}")
+        return duplicate
+
+    def _embed_screenshot(self, screenshot: bytes):
+        logger.info(
+            '</td></tr><tr><td colspan="3">'
+            '<img alt="screenshot" class="robot-seleniumlibrary-screenshot" '
+            'style="max-width:900px;max-height:900px;" '
+            f'src="data:image/png;base64,{base64.b64encode(screenshot).decode()}"/>',
+            html=True,
+        )
+
+    def _log_screenshot_link(self, path: str):
+        link = get_link_path(path, self.log_dir)
+        logger.info(
+            '</td></tr><tr><td colspan="3">'
+            f'<a href="{link}" target="_blank">'
+            f'<img src="{link}" style="max-width:800px;max-height:800px;"/></a>',
+            html=True,
+        )
+
     def _decide_embedded(self, filename: str) -> bool:
         return (
             filename in [DEFAULT_FILENAME_PAGE, DEFAULT_FILENAME_ELEMENT]
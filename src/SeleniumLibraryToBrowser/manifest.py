@@ -0,0 +1,92 @@
+"""Static keyword manifest of SeleniumLibraryToBrowser.
+
+The manifest lists all keywords with their implementation status and arguments, so that
+tools like SeleniumStats can use it without importing Browser or SeleniumLibrary.
+It is generated at build time with ``python -m SeleniumLibraryToBrowser.manifest``
+and shipped as package data next to this module. Its fingerprint is a hash of the keyword
+names, arguments and status, so that an outdated manifest can be detected.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+MANIFEST_FILE = Path(__file__).with_name("keywords.json")
+
+
+def normalize(name: str) -> str:
+    return name.replace(" ", "").replace("_", "").lower()
+
+
+@lru_cache(maxsize=None)
+def load_manifest(path: Path = MANIFEST_FILE) -> Dict[str, Any]:
+    """Returns the manifest or an empty one, if it has not been generated."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"version": None, "fingerprint": None, "keywords": {}}
+
+
+def describe_keywords(library) -> Dict[str, Dict[str, Any]]:
+    keywords = {}
+    for name in sorted(library.keywords):
+        tags = list(library.get_keyword_tags(name))
+        keywords[name] = {
+            "name": name.replace("_", " ").title(),
+            "normalized": normalize(name),
+            "implemented": "IMPLEMENTED" in tags,
+            "has_limitations": "HAS LIMITATIONS" in tags,
+            "args": [
+                arg if isinstance(arg, str) else f"{arg[0]}={arg[1]}"
+                for arg in library.get_keyword_arguments(name)
+            ],
+        }
+    return keywords
+
+
+def fingerprint(keywords: Dict[str, Dict[str, Any]]) -> str:
+    """Returns a hash of the names, arguments and status of ``keywords``."""
+    signatures = [
+        [name, keyword["implemented"], keyword["has_limitations"], keyword["args"]]
+        for name, keyword in sorted(keywords.items())
+    ]
+    return hashlib.sha256(json.dumps(signatures).encode("utf-8")).hexdigest()
+
+
+def build_manifest(library) -> Dict[str, Any]:
+    """Collects the manifest from a ``SeleniumLibraryToBrowser`` instance.
+
+    If SeleniumLibrary is installed, its documentation of implemented keywords is included,
+    so that it does not have to be imported for documentation later.
+    """
+    keywords = describe_keywords(library)
+    for name, keyword in keywords.items():
+        keyword["selenium_documentation"] = _get_selenium_documentation(library, name)
+    return {
+        "version": library.ROBOT_LIBRARY_VERSION,
+        "fingerprint": fingerprint(keywords),
+        "keywords": keywords,
+    }
+
+
+def _get_selenium_documentation(library, name: str):
+    if library.sl is None or "IMPLEMENTED" not in library.get_keyword_tags(name):
+        return None
+    try:
+        return library.sl.get_keyword_documentation(getattr(library.sl, name).robot_name or name)
+    except Exception:
+        return None
+
+
+def main():
+    from SeleniumLibraryToBrowser import SeleniumLibraryToBrowser  # noqa: PLC0415
+
+    manifest = build_manifest(SeleniumLibraryToBrowser())
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {len(manifest['keywords'])} keywords to {MANIFEST_FILE}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import time
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from robot.api import logger
+
+
+class PollingStatistics:
+    """Poll counters of one keyword."""
+
+    def __init__(self):
+        self.calls = 0
+        self.polls = 0
+        self.successes = 0
+        self.time_to_success = 0.0
+        self.max_time_to_success = 0.0
+
+    def record(self, polls: int, elapsed: float, success: bool):
+        self.calls += 1
+        self.polls += polls
+        if success:
+            self.successes += 1
+            self.time_to_success += elapsed
+            self.max_time_to_success = max(self.max_time_to_success, elapsed)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "polls": self.polls,
+            "successes": self.successes,
+            "mean_time_to_success": (
+                round(self.time_to_success / self.successes, 4) if self.successes else 0.0
+            ),
+            "max_time_to_success": round(self.max_time_to_success, 4),
+        }
+
+
+class PollingScheduler:
+    """Retries an attempt with exponentially growing intervals until a deadline.
+
+    The first retry happens after ``initial_interval`` seconds, every further interval
+    is ``factor`` times longer, up to ``max_interval``. No sleep ends after the deadline.
+    """
+
+    def __init__(
+        self, initial_interval: float = 0.05, max_interval: float = 0.5, factor: float = 2.0
+    ):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.statistics: Dict[str, PollingStatistics] = {}
+        self._deferred_messages: List[str] = []
+
+    def configure(self, initial_interval: float, max_interval: float):
+        if initial_interval <= 0:
+            raise ValueError("Polling interval must be greater than zero.")
+        self.initial_interval = initial_interval
+        self.max_interval = max(max_interval, initial_interval)
+
+    def poll(
+        self,
+        attempt: Callable[[], Any],
+        timeout: float,
+        name: str,
+        retry_on: Tuple[Type[Exception], ...] = (Exception,),
+        defer_log: bool = False,
+    ) -> Any:
+        """Calls ``attempt`` until it does not raise one of ``retry_on`` and returns its result.
+
+        ``attempt`` is called at least once. When ``timeout`` seconds have passed,
+        the last exception is raised. With ``defer_log``, the poll count is only logged
+        by `flush_log`, for example after a temporarily raised log level is restored.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        interval = self.initial_interval
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                result = attempt()
+            except retry_on:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._record(name, polls, time.monotonic() - start, False, defer_log)
+                    raise
+                time.sleep(min(interval, remaining))
+                interval = min(interval * self.factor, self.max_interval)
+            else:
+                self._record(name, polls, time.monotonic() - start, True, defer_log)
+                return result
+
+    def _record(self, name: str, polls: int, elapsed: float, success: bool, defer_log: bool):
+        self.statistics.setdefault(name, PollingStatistics()).record(polls, elapsed, success)
+        outcome = "succeeded" if success else "timed out"
+        message = f"'{name}' {outcome} after {polls} poll(s) in {elapsed:.3f} seconds."
+        if defer_log:
+            self._deferred_messages.append(message)
+        else:
+            logger.debug(message)
+
+    def flush_log(self):
+        messages, self._deferred_messages = self._deferred_messages, []
+        for message in messages:
+            logger.debug(message)
+
+    def clear(self):
+        self.statistics.clear()
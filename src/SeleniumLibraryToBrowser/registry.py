@@ -0,0 +1,42 @@
+from typing import Dict, Iterable, List, Optional
+
+
+class PageRegistry:
+    """Keeps the pages of each browser context in the order they were opened.
+
+    Each context maps to an insertion-ordered dict used as an ordered set,
+    so that adding, removing and looking up a page does not depend on the number of pages.
+    """
+
+    def __init__(self):
+        self._contexts: Dict[str, Dict[str, None]] = {}
+
+    def __contains__(self, context_id: str) -> bool:
+        return context_id in self._contexts
+
+    def add_context(self, context_id: str, page_ids: Iterable[str] = ()):
+        self._contexts[context_id] = dict.fromkeys(page_ids)
+
+    def remove_context(self, context_id: str):
+        self._contexts.pop(context_id, None)
+
+    def clear(self):
+        self._contexts.clear()
+
+    def reconcile(self, context_id: str, page_ids: Iterable[str]):
+        """Adds the pages that are new to ``context_id`` and drops the ones that are gone."""
+        pages = self._contexts.setdefault(context_id, {})
+        open_pages = dict.fromkeys(page_ids)
+        for page_id in pages.keys() - open_pages.keys():
+            del pages[page_id]
+        for page_id in open_pages:
+            if page_id not in pages:
+                pages[page_id] = None
+
+    def page_ids(self, context_ids: Optional[Iterable[str]] = None) -> List[str]:
+        """Returns the pages of the given contexts, or of all contexts, in opening order."""
+        if context_ids is None:
+            contexts = self._contexts.values()
+        else:
+            contexts = [self._contexts[ctx] for ctx in context_ids if ctx in self._contexts]
+        return [page_id for pages in contexts for page_id in pages]
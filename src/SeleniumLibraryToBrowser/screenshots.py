@@ -0,0 +1,163 @@
+import hashlib
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from robot.api import logger
+
+
+class ScreenshotWriter:
+    """Moves captured screenshots to their final path in a background thread.
+
+    Playwright writes a screenshot while capturing it, so the capture itself stays synchronous.
+    It is written to a local staging directory instead, and the slow part, writing it to the
+    output directory that may be on a network share, happens in a worker thread.
+    At most ``max_pending`` screenshots wait for the worker, further captures block until
+    there is room again.
+    """
+
+    def __init__(self, max_pending: int = 32):
+        self._queue: queue.Queue[Optional[Tuple[Path, Path]]] = queue.Queue(max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._staging_directory: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._pending: Set[Path] = set()
+        self._next_index: Dict[str, int] = {}
+        self._errors: List[str] = []
+
+    def staging_path(self) -> Path:
+        """Returns a new path without suffix in the local staging directory."""
+        if self._staging_directory is None:
+            self._staging_directory = Path(tempfile.mkdtemp(prefix="sl2b-screenshots-"))
+        return self._staging_directory / uuid.uuid4().hex
+
+    def reserve(self, path: str, file_type: str = "png") -> Path:
+        """Returns the final path for ``path`` without suffix and marks it as pending.
+
+        ``{index}`` is replaced like Browser does, with the first index whose file
+        neither exists nor is still waiting to be written.
+        """
+        base = Path(path)
+        if "{index}" not in base.name:
+            target = base.with_name(f"{base.name}.{file_type}")
+            with self._lock:
+                self._pending.add(target)
+            return target
+        index = self._next_index.get(path, 1)
+        while True:
+            target = base.with_name(f"{base.name.format(index=index)}.{file_type}")
+            with self._lock:
+                if target not in self._pending and not target.is_file():
+                    self._pending.add(target)
+                    self._next_index[path] = index + 1
+                    return target
+            index += 1
+
+    def release(self, target: Path):
+        """Frees a reserved path that is not going to be written, so its index is used again."""
+        with self._lock:
+            self._pending.discard(target)
+            self._next_index.clear()
+
+    def submit(self, staged: Path, target: Path):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="SeleniumLibraryToBrowser screenshots", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((staged, target))
+
+    def flush(self):
+        """Waits until all pending screenshots are written and warns about failed ones."""
+        if self._thread is not None:
+            self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        for error in errors:
+            logger.warn(error)
+
+    def close(self):
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._staging_directory is not None:
+            shutil.rmtree(self._staging_directory, ignore_errors=True)
+            self._staging_directory = None
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            staged, target = item
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(staged), str(target))
+            except Exception as error:
+                with self._lock:
+                    self._errors.append(f"Could not write screenshot '{target}': {error}")
+            finally:
+                with self._lock:
+                    self._pending.discard(target)
+                self._queue.task_done()
+
+
+class FailureScreenshots:
+    """Limits and deduplicates the screenshots that are taken on failure.
+
+    ``limit`` is the maximum number of screenshots per test and ``interval`` the minimum
+    number of seconds between two of them. With ``deduplicate``, a screenshot that is
+    identical to the previous one of the same page is not kept.
+    """
+
+    def __init__(
+        self, limit: Optional[int] = None, interval: float = 0.0, deduplicate: bool = False
+    ):
+        self.limit = limit
+        self.interval = interval
+        self.deduplicate = deduplicate
+        self._count = 0
+        self._last_capture: Optional[float] = None
+        self._last_screenshots: Dict[Tuple[str, bool], Tuple[str, str]] = {}
+
+    @property
+    def active(self) -> bool:
+        return self.limit is not None or self.interval > 0 or self.deduplicate
+
+    def start_test(self):
+        self._count = 0
+        self._last_capture = None
+
+    def skip_reason(self) -> Optional[str]:
+        """Returns why the next screenshot must not be taken, or ``None`` if it may."""
+        if self.limit is not None and self._count >= self.limit:
+            return f"the limit of {self.limit} screenshot(s) per test is reached"
+        if self._last_capture is not None and time.monotonic() - self._last_capture < self.interval:
+            return f"the previous one was taken less than {self.interval} seconds ago"
+        return None
+
+    def record(self):
+        self._count += 1
+        self._last_capture = time.monotonic()
+
+    def find_duplicate(self, page_id: str, screenshot: bytes, path: str) -> Optional[str]:
+        """Returns the path of the previous identical screenshot of the page.
+
+        If there is none, ``path`` is remembered as the latest screenshot of the page.
+        Embedded and saved screenshots are compared separately.
+        """
+        key = (page_id, path == "EMBED")
+        digest = hashlib.blake2b(screenshot, digest_size=16).hexdigest()
+        previous = self._last_screenshots.get(key)
+        if previous is not None and previous[0] == digest:
+            return previous[1]
+        self._last_screenshots[key] = (digest, path)
+        return None
@@ -0,0 +1,89 @@
+import gzip
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
+from robot.utils import get_link_path
+
+LOG_LEVELS = ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "NONE")
+
+
+class PageSourceLog:
+    """Logs page sources to compressed side files instead of into the log.
+
+    With ``to_file``, each source is written to a gzip compressed ``page-source-<index>.html.gz``
+    next to the log file and only a link is logged. Sources longer than ``max_size``
+    characters are truncated. A source identical to one already logged in the same test
+    is not logged again, the log refers to the earlier one instead. Nothing is written when
+    ``level`` is below the current log level.
+    """
+
+    def __init__(self, to_file: bool = False, max_size: Optional[int] = None):
+        self.to_file = to_file
+        self.max_size = max_size
+        self._logged: Dict[str, Optional[Path]] = {}
+        self._next_index = 1
+
+    @property
+    def active(self) -> bool:
+        return self.to_file or self.max_size is not None
+
+    def start_test(self):
+        self._logged = {}
+
+    def log(self, source: str, level: str, directory: Path):
+        if not self._is_logged(level):
+            return
+        digest = hashlib.blake2b(source.encode("UTF-8"), digest_size=16).hexdigest()
+        if digest in self._logged:
+            path = self._logged[digest]
+            if path is None:
+                logger.write("Page source is identical to the one logged before.", level=level)
+            else:
+                self._write_link("Page source is identical to", path, level, directory)
+            return
+        source = self._truncate(source)
+        if not self.to_file:
+            self._logged[digest] = None
+            logger.write(source, level=level)
+            return
+        path = self._get_path(directory)
+        with gzip.open(path, "wt", encoding="UTF-8", compresslevel=6) as source_file:
+            source_file.write(source)
+        self._logged[digest] = path
+        self._write_link("Page source", path, level, directory)
+
+    @staticmethod
+    def _is_logged(level: str) -> bool:
+        try:
+            current = BuiltIn().get_variable_value("${LOG_LEVEL}", "TRACE")
+        except RobotNotRunningError:
+            return True
+        level = "INFO" if level.upper() == "HTML" else level.upper()
+        current = str(current).split(":")[0].upper()
+        if level not in LOG_LEVELS or current not in LOG_LEVELS:
+            return True
+        return LOG_LEVELS.index(level) >= LOG_LEVELS.index(current)
+
+    def _truncate(self, source: str) -> str:
+        if self.max_size is None or len(source) <= self.max_size:
+            return source
+        return (
+            f"{source[: self.max_size]}\n"
+            f"<!-- Page source truncated to {self.max_size} of {len(source)} characters. -->"
+        )
+
+    def _get_path(self, directory: Path) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        while True:
+            path = directory / f"page-source-{self._next_index}.html.gz"
+            self._next_index += 1
+            if not path.exists():
+                return path
+
+    @staticmethod
+    def _write_link(text: str, path: Path, level: str, directory: Path):
+        link = get_link_path(str(path), str(directory))
+        logger.write(f'{text} <a href="{link}">{link}</a>', level=level, html=True)
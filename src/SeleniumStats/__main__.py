@@ -1,23 +1,41 @@
+import argparse
+import glob
 import hashlib
 import json
 import os
 import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
 
 from robot.api import ExecutionResult, ResultVisitor
 from robot.model import TestCase, TestSuite
 from robot.result import Keyword
 from robot.version import get_version, get_full_version
 
-try:
-    from SeleniumLibraryToBrowser import SeleniumLibraryToBrowser
+from . import diff
+from .outputxml import SELENIUM_LIBRARIES, get_elapsed_seconds, get_libname, normalize
+from .timing import ElapsedTimeSketch
 
-    sl2b = SeleniumLibraryToBrowser()
-    sl2b_keywords = [
-        kw.replace(" ", "").replace("_", "").lower() for kw in sl2b.get_keyword_names()
-    ]
-except ImportError:
-    sl2b = None
-    sl2b_keywords = []
+
+def load_keyword_manifest():
+    """Reads the keyword manifest shipped with SeleniumLibraryToBrowser.
+
+    The package is only located, not imported, so neither Browser nor SeleniumLibrary is loaded.
+    """
+    spec = find_spec("SeleniumLibraryToBrowser")
+    if spec is None or spec.origin is None:
+        return None
+    manifest_file = Path(spec.origin).with_name("keywords.json")
+    if not manifest_file.is_file():
+        return None
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    return {keyword["normalized"]: keyword for keyword in manifest["keywords"].values()}
+
+
+sl2b_keywords = load_keyword_manifest()
 
 RF_MAJOR_VERSION = int(get_version().split(".")[0])
 
@@ -26,102 +44,316 @@ class KeywordCall:
     def __init__(self, parent_hash: str):
         self.call_count: int = 1
         self.parents = {parent_hash}
+        self.elapsed = ElapsedTimeSketch()
 
     def add(self, parent_hash: str):
         self.call_count += 1
         self.parents.add(parent_hash)
 
+    def merge(self, other: "KeywordCall"):
+        self.call_count += other.call_count
+        self.parents |= other.parents
+        self.elapsed.merge(other.elapsed)
+
     def to_dict(self):
-        return {"call_count": self.call_count, "parent_count": len(self.parents)}
+        return {
+            "call_count": self.call_count,
+            "parent_count": len(self.parents),
+            "elapsed": self.elapsed.to_dict(),
+        }
 
 
 KEYWORD_CALLS = {}
+PARENT_TAGS = {"kw", "test", "suite"}
+TIME_COLUMNS = {
+    "total": "total s",
+    "mean": "mean s",
+    "p50": "p50 s",
+    "p95": "p95 s",
+    "max": "max s",
+}
+
+
+@lru_cache(maxsize=4096)
+def hash_parent(name):
+    # we are hashing the names of the calling keywords, test cases or test suites
+    # because we never want to store your names even temporarily!
+    # the hashes just allows us to count the different calling parents.
+    # We even do not store the entire hash, but just 16 bytes.
+    # it will never be possible to get the names back
+    # The cache of recent hashes only lives in memory while the output.xml is analyzed.
+    return hashlib.sha3_512(name.encode("UTF-8")).hexdigest()[16:32]
+
+
+def add_keyword_call(keyword_calls, kw_name, parent_hash):
+    if kw_name not in keyword_calls:
+        keyword_calls[kw_name] = KeywordCall(parent_hash)
+    else:
+        keyword_calls[kw_name].add(parent_hash)
+    return keyword_calls[kw_name]
+
+
+def merge_keyword_calls(keyword_calls, other_calls):
+    for kw_name, keyword_call in other_calls.items():
+        if kw_name not in keyword_calls:
+            keyword_calls[kw_name] = keyword_call
+        else:
+            keyword_calls[kw_name].merge(keyword_call)
 
 
 class ResultAnalyzer(ResultVisitor):
+    def __init__(self, keyword_calls=None):
+        self.keyword_calls = KEYWORD_CALLS if keyword_calls is None else keyword_calls
+        self._parent = None
+        self._parent_hash = None
+
     def start_keyword(self, keyword):
-        if keyword.libname in ["SeleniumLibrary", "SeleniumLibraryToBrowser"]:
-            # next we are hashing the names of the calling keywords, test cases or test suites
-            # because we never want to store your names even temporarily!
-            # the hashes just allows us to count the different calling parents.
-            # We even do not store the entire hash, but just 16 bytes.
-            # it will never be possible to get the names back
-            parent = self.get_keyword_or_test_parent(keyword)
-            if isinstance(parent, (TestCase, TestSuite)):
-                parent_hash = hashlib.sha3_512(parent.longname.encode("UTF-8")).hexdigest()[16:32]
-            else:
-                parent_hash = hashlib.sha3_512(
-                    f"{parent.libname}{parent.name}".encode()
-                ).hexdigest()[16:32]
+        if keyword.libname in SELENIUM_LIBRARIES:
+            parent_hash = self.get_parent_hash(self.get_keyword_or_test_parent(keyword))
             if RF_MAJOR_VERSION >= 7:
                 kw_name = keyword.name
+                elapsed = keyword.elapsed_time.total_seconds()
             else:
                 kw_name = keyword.name[len(keyword.libname) + 1 :]
-            if kw_name not in KEYWORD_CALLS:
-                KEYWORD_CALLS[kw_name] = KeywordCall(parent_hash)
-            else:
-                KEYWORD_CALLS[kw_name].add(parent_hash)
+                elapsed = keyword.elapsedtime / 1000
+            keyword_call = add_keyword_call(self.keyword_calls, kw_name, parent_hash)
+            keyword_call.elapsed.add(elapsed)
 
     def get_keyword_or_test_parent(self, keyword):
-        if not isinstance(keyword.parent, (Keyword, TestCase, TestSuite)):
-            return self.get_keyword_or_test_parent(keyword.parent)
-        return keyword.parent
-
-    def end_total_statistics(self, stats):
-        kw_calls = {}
-        for key in sorted(KEYWORD_CALLS.keys()):
-            kw_calls[key] = KEYWORD_CALLS[key].to_dict()
-        self.print_stats(kw_calls)
-        json_stats = json.dumps(kw_calls, indent=2)
-        with open("keyword_stats.json", "w") as keyword_stats_file:
-            keyword_stats_file.write(json_stats)
-        print(f'\nStatistics File: {os.path.abspath("keyword_stats.json")}')
+        parent = keyword.parent
+        while not isinstance(parent, (Keyword, TestCase, TestSuite)):
+            parent = parent.parent
+        return parent
+
+    def get_parent_hash(self, parent):
+        # Consecutive calls mostly share their parent object. Other parents are
+        # looked up by name, because every call of a user keyword is a new object.
+        if parent is not self._parent:
+            if isinstance(parent, (TestCase, TestSuite)):
+                name = parent.longname
+            else:
+                name = f"{parent.libname}{parent.name}"
+            self._parent = parent
+            self._parent_hash = hash_parent(name)
+        return self._parent_hash
+
+    # Messages, statistics and errors never contain keywords, so they are not visited at all.
+    def visit_message(self, message):
+        pass
+
+    def visit_statistics(self, stats):
+        pass
+
+    def visit_errors(self, errors):
+        pass
+
+
+class StreamingResultAnalyzer:
+    """Analyzes an output.xml without building the result model.
+
+    The file is read with an incremental parser. Only the names of the enclosing
+    suites, tests and keywords are kept on a stack and every element is discarded
+    as soon as it is closed, so memory depends on the nesting depth, not on the file size.
+    The elapsed time of a keyword is taken from its ``<status>``, which is its last child.
+    """
+
+    def __init__(self, keyword_calls=None):
+        self.keyword_calls = KEYWORD_CALLS if keyword_calls is None else keyword_calls
+        self.parents = []
+
+    def analyze(self, output_xml):
+        elements = []
+        for event, element in ET.iterparse(output_xml, events=("start", "end")):
+            if event == "start":
+                elements.append(element)
+                if element.tag in PARENT_TAGS:
+                    self.start_parent(element)
+                continue
+            elements.pop()
+            if element.tag in PARENT_TAGS:
+                self.parents.pop()
+            elif element.tag == "status" and elements and elements[-1].tag == "kw":
+                keyword_call = self.parents[-1][2]
+                if keyword_call is not None:
+                    keyword_call.elapsed.add(get_elapsed_seconds(element))
+            element.clear()
+            if elements:
+                elements[-1].remove(element)
+
+    def start_parent(self, element):
+        name = element.get("name", "")
+        if element.tag != "kw":
+            if self.parents and self.parents[-1][0] != "kw":
+                name = f"{self.parents[-1][1]}.{name}"
+            self.parents.append((element.tag, name, None))
+            return
+        libname = get_libname(element)
+        keyword_call = None
+        if libname in SELENIUM_LIBRARIES:
+            parent_hash = hash_parent(self.parents[-1][1])
+            keyword_call = add_keyword_call(self.keyword_calls, name, parent_hash)
+        if RF_MAJOR_VERSION < 7 and libname:  # noqa: PLR2004
+            name = f"{libname}.{name}"
+        self.parents.append(("kw", f"{libname}{name}", keyword_call))
+
+
+def analyze_file(output_xml, stream=False):
+    """Returns the keyword calls of one output.xml as a new table."""
+    keyword_calls = {}
+    if stream:
+        StreamingResultAnalyzer(keyword_calls).analyze(output_xml)
+    else:
+        ExecutionResult(output_xml).visit(ResultAnalyzer(keyword_calls))
+    return keyword_calls
+
+
+def analyze_files(output_xmls, jobs=None, stream=False):
+    """Analyzes the files in a process pool and merges their keyword calls.
+
+    Every worker returns the table of one file, so parent hashes are merged exactly.
+    With one job or one file, everything runs in this process.
+    """
+    keyword_calls = {}
+    total = len(output_xmls)
+    if jobs == 1 or total == 1:
+        for index, output_xml in enumerate(output_xmls, 1):
+            print(f"[{index}/{total}] reading results from: {output_xml}")  # noqa: T201
+            merge_keyword_calls(keyword_calls, analyze_file(output_xml, stream))
+        return keyword_calls
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(analyze_file, output_xml, stream): output_xml
+            for output_xml in output_xmls
+        }
+        for index, future in enumerate(as_completed(futures), 1):
+            merge_keyword_calls(keyword_calls, future.result())
+            print(f"[{index}/{total}] read results from: {futures[future]}")  # noqa: T201
+    return keyword_calls
+
+
+def expand_paths(patterns):
+    output_xmls = {}
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)) or [pattern]:  # noqa: PTH207
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"{path} is no file")
+            output_xmls[os.path.abspath(path)] = None
+    return list(output_xmls)
+
+
+def write_stats(keyword_calls=KEYWORD_CALLS, sort="name"):
+    kw_calls = {}
+    for key in sorted(keyword_calls.keys()):
+        kw_calls[key] = keyword_calls[key].to_dict()
+    if sort == "time":
+        print_stats(dict(sorted(kw_calls.items(), key=lambda item: -item[1]["elapsed"]["total"])))
+    elif sort == "count":
+        print_stats(dict(sorted(kw_calls.items(), key=lambda item: -item[1]["call_count"])))
+    else:
+        print_stats(kw_calls)
+    json_stats = json.dumps(kw_calls, indent=2)
+    with open("keyword_stats.json", "w") as keyword_stats_file:
+        keyword_stats_file.write(json_stats)
+    print(f'\nStatistics File: {os.path.abspath("keyword_stats.json")}')
+    print(
+        "Please upload the file to https://data.keyword-driven.de/index.php/s/SeleniumStats for full anonymity."
+    )
+    print("IP-Addresses or other personal data are not logged when uploading the file!")
+    print("You can also mail it to mailto:rene@robotframework.org.\n")
+    print("Thank you very much for your support!")
+    print("Your Browser-Team (Mikko, Tatu, Kerkko, Janne and René)")
+
+
+def print_stats(kw_calls):
+    longest_keyword = 0
+    for kw_name in kw_calls:
+        current_length = len(kw_name)
+        longest_keyword = current_length if current_length > longest_keyword else longest_keyword
+    time_separator = "-----------+" * len(TIME_COLUMNS)
+    time_header = "".join(f" {header.ljust(9)} |" for header in TIME_COLUMNS.values())
+    print(
+        f'+-{"".ljust(longest_keyword, "-")}-+-------+---------+{time_separator}------------------+'
+    )
+    print(
+        f'| {"Keyword".ljust(longest_keyword, " ")} | count | parents |{time_header} migration status |'
+    )
+    print(
+        f'+-{"".ljust(longest_keyword, "-")}-+-------+---------+{time_separator}------------------+'
+    )
+    for kw_name in kw_calls:
+        if sl2b_keywords is not None:
+            sl2b_keyword = sl2b_keywords.get(normalize(kw_name))
+            if sl2b_keyword is None:
+                continue
+            if not sl2b_keyword["implemented"]:
+                status = "missing"
+            elif sl2b_keyword["has_limitations"]:
+                status = "has limitations"
+            else:
+                status = ""
+            msg = f' {status.ljust(16, " ")} |'
+        else:
+            msg = f' {"unknown".ljust(16, " ")} |'
+        elapsed = kw_calls[kw_name]["elapsed"]
+        times = "".join(f" {f'{elapsed[column]:.3f}'.ljust(9)} |" for column in TIME_COLUMNS)
         print(
-            "Please upload the file to https://data.keyword-driven.de/index.php/s/SeleniumStats for full anonymity."
+            f'| {kw_name.ljust(longest_keyword , " ")} |'
+            f' {str(kw_calls[kw_name]["call_count"]).ljust(5," ")} |'
+            f' {str(kw_calls[kw_name]["parent_count"]).ljust(7, " ")} |'
+            f"{times}"
+            f"{msg}"
         )
-        print("IP-Addresses or other personal data are not logged when uploading the file!")
-        print("You can also mail it to mailto:rene@robotframework.org.\n")
-        print("Thank you very much for your support!")
-        print("Your Browser-Team (Mikko, Tatu, Kerkko, Janne and René)")
-
-    def print_stats(self, kw_calls):
-        longest_keyword = 0
-        for kw_name in kw_calls:
-            current_length = len(kw_name)
-            longest_keyword = (
-                current_length if current_length > longest_keyword else longest_keyword
-            )
-        print(f'+-{"".ljust(longest_keyword, "-")       }-+-------+---------+------------------+')
-        print(f'| {"Keyword".ljust(longest_keyword, " ")} | count | parents | migration status |')
-        print(f'+-{"".ljust(longest_keyword, "-")       }-+-------+---------+------------------+')
-        for kw_name in kw_calls:
-            if sl2b is not None:
-                if kw_name.replace(" ", "").lower() not in sl2b_keywords:
-                    continue
-                implemented = sl2b.keyword_implemented(kw_name.lower().replace(" ", "_"))
-                msg = f' {str((not implemented) * "missing").ljust(16, " ")} |'
-            else:
-                msg = f' {"unknown".ljust(16, " ")} |'
-            print(
-                f'| {kw_name.ljust(longest_keyword , " ")} |'
-                f' {str(kw_calls[kw_name]["call_count"]).ljust(5," ")} |'
-                f' {str(kw_calls[kw_name]["parent_count"]).ljust(7, " ")} |'
-                f"{msg}"
-            )
-        print(f'+-{"".ljust(longest_keyword, "-")}-+-------+---------+------------------+')
+    print(
+        f'+-{"".ljust(longest_keyword, "-")}-+-------+---------+{time_separator}------------------+'
+    )
 
 
 def main():
-    if len(sys.argv) > 1:
-        original_output_xml = sys.argv[1]
-        if not os.path.isfile(original_output_xml):
-            raise FileNotFoundError(f"{original_output_xml} is no file")
-        print(f"reading results from: {os.path.abspath(original_output_xml)}")
-        ExecutionResult(original_output_xml).visit(ResultAnalyzer())
-    else:
+    if sys.argv[1:2] == ["diff"]:
+        diff.main(sys.argv[2:])
+        return
+    parser = argparse.ArgumentParser(
+        prog="python -m SeleniumStats",
+        description="Counts the SeleniumLibrary keyword calls in one or more output.xml files.",
+        epilog="Use 'python -m SeleniumStats diff before.xml after.xml' to compare two runs.",
+    )
+    parser.add_argument(
+        "output_xml",
+        nargs="*",
+        help="paths or glob patterns of output.xml files, like results/**/output.xml",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read the output.xml incrementally instead of loading it entirely into memory",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        help="number of worker processes for multiple files (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--sort",
+        choices=["name", "count", "time"],
+        default="name",
+        help="order of the printed table: by keyword name, call count or total elapsed time",
+    )
+    args = parser.parse_args()
+    if not args.output_xml:
         print(
             "Use the path to a output.xml as first argument.  Example:  python -m SeleniumStats ../output.xml"
         )
+        return
+    output_xmls = expand_paths(args.output_xml)
+    keyword_calls = analyze_files(output_xmls, args.jobs, args.stream)
+    write_stats(keyword_calls, args.sort)
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+    return number
 
 
 if __name__ == "__main__":
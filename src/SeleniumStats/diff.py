@@ -0,0 +1,223 @@
+"""Compares the timings of two runs of the same suite.
+
+The first output.xml is usually from a run with SeleniumLibrary, the second one from
+a run with SeleniumLibraryToBrowser. Keywords are matched by their normalized name and
+tests by their full name below the top-level suite. Both files are read incrementally
+and in parallel, so even outputs of several gigabytes need only little memory.
+
+Usage: ``python -m SeleniumStats diff before.xml after.xml``
+"""
+
+# ruff: noqa: T201  # the report is printed to the console
+import argparse
+import json
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .outputxml import SELENIUM_LIBRARIES, get_elapsed_seconds, get_libname, normalize
+from .timing import ElapsedTimeSketch
+
+
+class RunProfile:
+    """Elapsed times of the SeleniumLibrary keywords, of the tests and of the whole run."""
+
+    def __init__(self):
+        self.keywords = {}
+        self.keyword_names = {}
+        self.tests = {}
+        self.total = 0.0
+
+    def analyze(self, output_xml):
+        elements = []
+        suites = []
+        for event, element in ET.iterparse(output_xml, events=("start", "end")):
+            if event == "start":
+                elements.append(element)
+                if element.tag == "suite":
+                    suites.append(self.get_full_name(element, suites))
+                continue
+            elements.pop()
+            if element.tag == "status" and elements:
+                self.end_status(elements[-1], element, suites)
+            elif element.tag == "suite":
+                suites.pop()
+            element.clear()
+            if elements:
+                elements[-1].remove(element)
+        return self
+
+    def end_status(self, parent, status, suites):
+        if parent.tag == "kw":
+            if get_libname(parent) in SELENIUM_LIBRARIES:
+                name = parent.get("name", "")
+                key = normalize(name)
+                self.keyword_names.setdefault(key, name)
+                self.keywords.setdefault(key, ElapsedTimeSketch()).add(get_elapsed_seconds(status))
+        elif parent.tag == "test":
+            self.tests[self.get_full_name(parent, suites)] = get_elapsed_seconds(status)
+        elif parent.tag == "suite" and len(suites) == 1:
+            self.total = get_elapsed_seconds(status)
+
+    @staticmethod
+    def get_full_name(element, suites):
+        # The top-level suite is left out, because it is often renamed between runs.
+        if not suites:
+            return ""
+        name = element.get("name", "")
+        return f"{suites[-1]}.{name}" if suites[-1] else name
+
+
+def read_profile(output_xml):
+    return RunProfile().analyze(output_xml)
+
+
+def compare(before, after):
+    keywords = {}
+    for key in sorted(before.keywords.keys() | after.keywords.keys()):
+        old = before.keywords.get(key)
+        new = after.keywords.get(key)
+        name = after.keyword_names.get(key) or before.keyword_names[key]
+        keywords[name] = {
+            "before": timing_to_dict(old),
+            "after": timing_to_dict(new),
+            "mean_delta": round(new.mean - old.mean, 4) if old and new else None,
+            "total_delta": round(new.total - old.total, 4) if old and new else None,
+        }
+    tests = {
+        name: {
+            "before": round(before.tests[name], 4),
+            "after": round(after.tests[name], 4),
+            "delta": round(after.tests[name] - before.tests[name], 4),
+        }
+        for name in before.tests
+        if name in after.tests
+    }
+    return {
+        "summary": {
+            "before": round(before.total, 4),
+            "after": round(after.total, 4),
+            "speedup": round(before.total / after.total, 4) if after.total else None,
+            "tests_only_before": sorted(before.tests.keys() - after.tests.keys()),
+            "tests_only_after": sorted(after.tests.keys() - before.tests.keys()),
+        },
+        "slower_keywords": [
+            name for name, diff in keywords.items() if (diff["mean_delta"] or 0) > 0
+        ],
+        "keywords": keywords,
+        "tests": tests,
+    }
+
+
+def timing_to_dict(sketch):
+    if sketch is None:
+        return None
+    timing = {"calls": sketch.count}
+    timing.update(sketch.to_dict())
+    return timing
+
+
+def print_diff(diff, top):
+    keywords = sorted(diff["keywords"].items(), key=lambda item: -(item[1]["total_delta"] or 0))
+    print_table(
+        [
+            "Keyword",
+            "calls before",
+            "calls after",
+            "mean before s",
+            "mean after s",
+            "mean delta s",
+            "total delta s",
+        ],
+        [
+            [
+                name,
+                format_value(values["before"], "calls"),
+                format_value(values["after"], "calls"),
+                format_value(values["before"], "mean"),
+                format_value(values["after"], "mean"),
+                format_seconds(values["mean_delta"]),
+                format_seconds(values["total_delta"]),
+            ]
+            for name, values in keywords
+        ],
+    )
+    tests = sorted(diff["tests"].items(), key=lambda item: -item[1]["delta"])[:top]
+    if tests:
+        print(f"\nTests with the largest slowdown (top {top}):")
+        print_table(
+            ["Test", "before s", "after s", "delta s"],
+            [
+                [
+                    name,
+                    format_seconds(values["before"]),
+                    format_seconds(values["after"]),
+                    format_seconds(values["delta"]),
+                ]
+                for name, values in tests
+            ],
+        )
+    summary = diff["summary"]
+    speedup = f"{summary['speedup']:.2f}x" if summary["speedup"] is not None else "unknown"
+    print(
+        f"\nTotal elapsed time: {summary['before']:.3f} s before, {summary['after']:.3f} s after,"
+        f" speedup {speedup}"
+    )
+    for key in ["tests_only_before", "tests_only_after"]:
+        if summary[key]:
+            print(f"{len(summary[key])} test(s) only {key[len('tests_only_'):]}.")
+    if diff["slower_keywords"]:
+        print(f"Slower keywords: {', '.join(diff['slower_keywords'])}")
+    else:
+        print("No keyword got slower.")
+
+
+def format_value(timing, key):
+    if timing is None:
+        return "-"
+    if key == "calls":
+        return str(timing[key])
+    return format_seconds(timing[key])
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    return f"{round(seconds, 3) + 0.0:.3f}"  # + 0.0 turns -0.0 into 0.0
+
+
+def print_table(headers, rows):
+    widths = [
+        max([len(header)] + [len(row[i]) for row in rows]) for i, header in enumerate(headers)
+    ]
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    print(separator)
+    print("| " + " | ".join(header.ljust(width) for header, width in zip(headers, widths)) + " |")
+    print(separator)
+    for row in rows:
+        print("| " + " | ".join(cell.ljust(width) for cell, width in zip(row, widths)) + " |")
+    print(separator)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m SeleniumStats diff",
+        description="Compares keyword and test timings of two output.xml files of the same suite.",
+    )
+    parser.add_argument("before", help="output.xml of the run with SeleniumLibrary")
+    parser.add_argument("after", help="output.xml of the run with SeleniumLibraryToBrowser")
+    parser.add_argument("--output", default="performance_diff.json", help="path of the JSON report")
+    parser.add_argument(
+        "--top", type=int, default=10, help="number of the most slowed down tests to print"
+    )
+    args = parser.parse_args(argv)
+    for output_xml in [args.before, args.after]:
+        if not Path(output_xml).is_file():
+            raise FileNotFoundError(f"{output_xml} is no file")
+    print(f"comparing {Path(args.before).resolve()} with {Path(args.after).resolve()}")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        before, after = executor.map(read_profile, [args.before, args.after])
+    diff = compare(before, after)
+    print_diff(diff, args.top)
+    Path(args.output).write_text(json.dumps(diff, indent=2), encoding="utf-8")
+    print(f"\nDiff File: {Path(args.output).resolve()}")
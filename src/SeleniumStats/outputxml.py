@@ -0,0 +1,27 @@
+"""Helpers to read elements of an output.xml of any Robot Framework version."""
+
+from datetime import datetime
+
+SELENIUM_LIBRARIES = ["SeleniumLibrary", "SeleniumLibraryToBrowser"]
+RF6_TIMESTAMP_FORMAT = "%Y%m%d %H:%M:%S.%f"
+
+
+def normalize(name):
+    return name.replace(" ", "").replace("_", "").lower()
+
+
+def get_libname(keyword):
+    """Returns the library or resource of a ``<kw>`` element, ``owner`` since RF 7."""
+    return keyword.get("owner", keyword.get("library"))
+
+
+def get_elapsed_seconds(status):
+    """Returns the elapsed time of a ``<status>`` element of any output.xml schema."""
+    if "elapsed" in status.attrib:
+        return float(status.get("elapsed"))
+    try:
+        start = datetime.strptime(status.get("starttime"), RF6_TIMESTAMP_FORMAT)  # noqa: DTZ007
+        end = datetime.strptime(status.get("endtime"), RF6_TIMESTAMP_FORMAT)  # noqa: DTZ007
+    except (TypeError, ValueError):  # not run keywords have N/A as timestamps
+        return 0.0
+    return (end - start).total_seconds()
@@ -0,0 +1,70 @@
+import math
+from typing import Dict
+
+ZERO_SECONDS = 1e-6
+
+
+class ElapsedTimeSketch:
+    """Streaming distribution of elapsed times with a bounded relative error.
+
+    Times are counted in logarithmically sized buckets (like DDSketch), so every quantile
+    is accurate to ``relative_accuracy`` and memory depends on the range of the times,
+    not on their number. Sketches with the same accuracy can be merged exactly.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if seconds < ZERO_SECONDS:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(seconds) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "ElapsedTimeSketch"):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with a different relative accuracy.")
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.zero_count += other.zero_count
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, quantile: float) -> float:
+        """Returns the elapsed time below which ``quantile`` of all times are."""
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {quantile}.")
+        rank = quantile * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return min(2 * self._gamma**index / (self._gamma + 1), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "total": round(self.total, 4),
+            "mean": round(self.mean, 4),
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "max": round(self.max, 4),
+        }